@@ -92,6 +92,8 @@ def init_db():
 # strengthen Wikipedia URL canonicalization to collapse zh-HK / zh-SG / zh-MY
 #         variants, mobile hosts, and ?variant=... into a single canonical
 #         en/zh URL so duplicates don't get into DB or RAW_DIR.
+_zh_variant_path_re = re.compile(r"^/zh-[a-z-]+/(.+)$")
+
 def canon_url(u):
     # strip fragment
     u = urllib.parse.urldefrag(u)[0]
@@ -127,7 +129,7 @@ def canon_url(u):
     path = p.path or ""
 
     # normalize paths like /zh-hk/Title -> /wiki/Title
-    m = re.match(r"^/zh-[a-z-]+/(.+)$", path)
+    m = _zh_variant_path_re.match(path)
     if m:
         path = "/wiki/" + m.group(1)
 
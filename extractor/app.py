@@ -24,7 +24,7 @@ def ensure_out_dir() -> None:
             return
         raise
         
-EXTRACTOR_SKIP_CATEGORIES = os.getenv("EXTRACTOR_SKIP_CATEGORIES", "0")
+EXTRACTOR_SKIP_CATEGORIES = os.getenv("EXTRACTOR_SKIP_CATEGORIES", "1")
 EXTRACTOR_SKIP_LISTS      = os.getenv("EXTRACTOR_SKIP_LISTS", "1")
 EXTRACTOR_MIN_CHARS       = int(os.getenv("EXTRACTOR_MIN_CHARS", "180"))
 
@@ -32,6 +32,8 @@ UA = "ANJSO-Extractor/1.0 (+https://anjso.org/wiki)"
 HTTP_TIMEOUT = 20
 
 # topic_id normalizer (ASCII + prefer EN/url slug) 
+_whitespace_re = re.compile(r"\s+")
+_non_slug_re = re.compile(r"[^a-z0-9_]+")
 
 def normalize_topic_id(
     title: str | None,
@@ -66,8 +68,8 @@ def normalize_topic_id(
         # drop non-ASCII characters
         s_ascii = s.encode("ascii", "ignore").decode("ascii")
         s_ascii = s_ascii.lower().strip()
-        s_ascii = re.sub(r"\s+", "_", s_ascii)
-        s_ascii = re.sub(r"[^a-z0-9_]+", "", s_ascii)
+        s_ascii = _whitespace_re.sub("_", s_ascii)
+        s_ascii = _non_slug_re.sub("", s_ascii)
         if s_ascii:
             return s_ascii
 
@@ -8,6 +8,17 @@ from pathlib import Path
 from datetime import datetime, timezone
 import textwrap
 import shutil
+import gzip
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# orjson parses and serialises several times faster than json; the
+# stdlib module stays as the fallback when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Read environment variables for directories
@@ -16,12 +27,45 @@ SUMMARY_DIR  = Path(os.getenv("SUMMARY_DIR", str(DATA_DIR / "summarized")))
 SITE_DIR     = Path(os.getenv("SITE_DIR", "/site"))
 WIKI_WORKDIR = Path(os.getenv("WIKI_WORKDIR", "/tmp/wiki"))
 
+# Autolink title index cache; lives under DATA_DIR because WIKI_WORKDIR
+# is wiped on every build.
+TITLE_INDEX_CACHE = Path(os.getenv("TITLE_INDEX_CACHE", str(DATA_DIR / "publisher_title_index.json")))
+TITLE_INDEX_CACHE_VERSION = 1
+
+# Processes rendering tiddlers; small builds stay in-process because
+# starting the pool costs more than rendering a few hundred topics.
+PUBLISHER_WORKERS = int(os.getenv("PUBLISHER_WORKERS", str(os.cpu_count() or 1)))
+PARALLEL_RENDER_MIN_TOPICS = int(os.getenv("PARALLEL_RENDER_MIN_TOPICS", "500"))
+
 # SPECIAL CASE: all known titles for the tunnel topic                 
-TUNNEL_TITLES = {                                                   
+TUNNEL_TITLES = frozenset({
     "Nanjing Yingtian Avenue Yangtze River Tunnel",
     "南京应天大街长江隧道",
     "南京應天大街長江隧道",
-}
+})
+
+def json_loads_bytes(raw: bytes):
+    """Parse JSON bytes, tolerating a UTF-8 BOM like utf-8-sig does."""
+    if orjson is not None:
+        return orjson.loads(raw[3:] if raw.startswith(b"\xef\xbb\xbf") else raw)
+    return json.loads(raw)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Compact UTF-8 JSON (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Tags that never get their own tag tiddler / tiddler tag entry
+_SKIP_TAGS = frozenset({"", "summary"})
+
+# wiki-link patterns, compiled once (these run on every summary and body)
+_link_widget_re = re.compile(r"<\$link\b[^>]*>(.*?)</\$link>", re.DOTALL)
+_wikilink_re = re.compile(r"\[\[([^\]]+)\]\]")
+_nested_wikilink_re = re.compile(r"\[\[\s*\[\[([^\]]+)\]\]\s*\]\]")
+_non_alnum_re = re.compile(r"[^a-z0-9]+")
 
 # strip raw wiki-style links like [[Target]] or [[Target|Label]]
 # down to plain visible text so we don't carry Wikipedia markup into
@@ -40,9 +84,12 @@ def strip_wikilinks_markup(text: str) -> str:
         return text
 
     # 1) Strip TiddlyWiki <$link> widgets, keep inner label
-    def _repl_widget(m: re.Match) -> str:
-        return m.group(1)
-    text = re.sub(r"<\$link\b[^>]*>(.*?)</\$link>", _repl_widget, text, flags=re.DOTALL)
+    # (most summaries have neither kind of markup; skip the regex scans)
+    if "<$link" in text:
+        text = _link_widget_re.sub(r"\1", text)
+
+    if "[[" not in text:
+        return text
 
     # 2) Strip [[Title|Label]] / [[Title]]
     def _repl_brackets(m: re.Match) -> str:
@@ -52,7 +99,7 @@ def strip_wikilinks_markup(text: str) -> str:
             return inner.split("|")[-1]
         return inner
 
-    return re.sub(r"\[\[([^\]]+)\]\]", _repl_brackets, text)
+    return _wikilink_re.sub(_repl_brackets, text)
 
 
 
@@ -65,30 +112,111 @@ def normalize_for_compare(s: str) -> str:
     """
     if not s:
         return ""
-    s = s.lower()
-    # remove spaces and hyphens first
-    s = re.sub(r"[\s\-_]+", "", s)
-    # drop anything that isn't a letter or digit
-    s = re.sub(r"[^a-z0-9]+", "", s)
-    return s
+    # dropping anything that isn't a letter or digit also removes the
+    # spaces, hyphens and underscores
+    return _non_alnum_re.sub("", s.lower())
 
 
 # helper to collapse nested wiki-links like [[[[Foo]]]] -> [[Foo]]
 def squash_nested_wikilinks(text: str) -> str:
-    if not text:
+    # nesting needs at least two openers; skips the regex for plain text
+    if not text or text.count("[[") < 2:
         return text
     # Run a couple of times to catch deeper nesting if any.
     for _ in range(3):
-        new_text = re.sub(r"\[\[\s*\[\[([^\]]+)\]\]\s*\]\]", r"[[\1]]", text)
-        if new_text == text:
+        text, n = _nested_wikilink_re.subn(r"[[\1]]", text)
+        if not n:
             break
-        text = new_text
     return text
 
 
 
 # Autolink helpers
-def build_title_index():
+def summary_dir_signature() -> str:
+    """
+    Fingerprint SUMMARY_DIR from (name, mtime, size) of every *.json file.
+    Only stats the files; nothing is read or parsed.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{TITLE_INDEX_CACHE_VERSION}\n".encode("utf-8"))
+    try:
+        with os.scandir(SUMMARY_DIR) as it:
+            stats = sorted(
+                ((e.name, e.stat()) for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda item: item[0],
+            )
+    except FileNotFoundError:
+        stats = []
+    for name, st in stats:
+        h.update(f"{name}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_title_index_cache(signature: str):
+    """Return (en_titles, zh_titles) from the disk cache if it matches signature."""
+    try:
+        cached = json_loads_bytes(TITLE_INDEX_CACHE.read_bytes())
+    except Exception:
+        return None
+    if not isinstance(cached, dict) or cached.get("signature") != signature:
+        return None
+    en_titles = list(cached.get("en_titles") or [])
+    zh_titles = [tuple(pair) for pair in cached.get("zh_titles") or []]
+    return en_titles, zh_titles
+
+
+def save_title_index_cache(signature: str, en_titles, zh_titles) -> None:
+    payload = {
+        "signature": signature,
+        "en_titles": en_titles,
+        "zh_titles": [list(pair) for pair in zh_titles],
+    }
+    try:
+        TITLE_INDEX_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TITLE_INDEX_CACHE.with_suffix(".tmp")
+        tmp.write_bytes(json_dumps_bytes(payload))
+        tmp.replace(TITLE_INDEX_CACHE)
+    except OSError as e:
+        # cache is best-effort; a read-only DATA_DIR just means no reuse
+        print(f"[WARN] could not write title index cache: {e}", flush=True)
+
+
+def load_all_summaries() -> list[tuple[Path, dict]]:
+    """
+    Read and parse every summary JSON in SUMMARY_DIR once, sorted by name.
+
+    build_wiki() and generate_summaries_output() share the result so a
+    publish run parses each file a single time. Unreadable files are
+    reported and left out.
+    """
+    summaries = []
+    try:
+        with os.scandir(SUMMARY_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        return summaries
+    for entry in entries:
+        try:
+            with open(entry.path, "rb") as f:
+                data = json_loads_bytes(f.read())
+        except Exception as e:
+            print(f"[WARN] skipping {entry.name}: {e}", flush=True)
+            continue
+        if not isinstance(data, dict):
+            print(f"[WARN] skipping {entry.name}: not a JSON object", flush=True)
+            continue
+        summaries.append((Path(entry.path), data))
+    return summaries
+
+
+# signature -> (en_titles, zh_titles) of the last index built in this process
+_title_index_memo: dict[str, tuple[tuple, tuple]] = {}
+
+
+def build_title_index(summaries: list[tuple[Path, dict]] | None = None):
     """
     Scan all summarized JSON files and collect:
     - English titles (for linking English text)
@@ -96,16 +224,31 @@ def build_title_index():
 
     Only index titles that actually have at least one non-empty summary,
     so we never autolink to completely missing/empty pages.
+
+    The result is cached on disk keyed by summary_dir_signature(), so a
+    rebuild with unchanged summaries skips re-parsing every JSON file.
+    Within one process the last result is also kept in memory, so repeat
+    calls only pay for the directory stat. Pass summaries (from
+    load_all_summaries()) to avoid re-reading the files on a cache miss.
     """
+    signature = summary_dir_signature()
+    memo = _title_index_memo.get(signature)
+    if memo is not None:
+        return list(memo[0]), list(memo[1])
+
+    cached = load_title_index_cache(signature)
+    if cached is not None:
+        print("[publisher] Reusing cached title index", flush=True)
+        _title_index_memo.clear()
+        _title_index_memo[signature] = (tuple(cached[0]), tuple(cached[1]))
+        return cached
+
     en_titles = []
     zh_titles = []
 
-    for json_path in Path(SUMMARY_DIR).glob("*.json"):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8-sig"))
-        except Exception:
-            continue
-
+    if summaries is None:
+        summaries = load_all_summaries()
+    for json_path, data in summaries:
         # Only consider items that have at least some summary text
         has_summary = bool(
             (data.get("summary_en") or "").strip()
@@ -143,10 +286,47 @@ def build_title_index():
     # Link longer phrases first to avoid shorter ones eating them
     en_titles.sort(key=len, reverse=True)
     zh_titles.sort(key=lambda x: len(x[0]), reverse=True)
+    save_title_index_cache(signature, en_titles, zh_titles)
+    _title_index_memo.clear()
+    _title_index_memo[signature] = (tuple(en_titles), tuple(zh_titles))
     return en_titles, zh_titles
 
 
-def autolink_en(text: str, en_titles, current_title: str) -> str:
+_word_re = re.compile(r"\w+")
+
+
+# first word of each title -> titles starting with it ("" collects titles
+# without any word characters, which can't be prefiltered)
+@lru_cache(maxsize=8)
+def _en_titles_by_first_word(en_titles: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    by_word: dict[str, list[str]] = {}
+    for t in en_titles:
+        if not t:
+            continue
+        m = _word_re.search(t)
+        by_word.setdefault(m.group(0) if m else "", []).append(t)
+    return {w: tuple(ts) for w, ts in by_word.items()}
+
+
+# One alternation regex over a set of English titles. Longest titles come
+# first, so at any position the longest matching title wins. Articles
+# mention few titles, so the candidate sets repeat and the cache stays hot.
+@lru_cache(maxsize=1024)
+def _en_title_matcher(en_titles: tuple[str, ...]) -> re.Pattern | None:
+    titles = sorted((t for t in set(en_titles) if t), key=len, reverse=True)
+    if not titles:
+        return None
+    alternation = "|".join(re.escape(t) for t in titles)
+    return re.compile(r'(?<!\[)\b(?:' + alternation + r')\b(?!\])')
+
+
+def autolink_en(
+    text: str,
+    en_titles,
+    current_title: str,
+    *,
+    by_word: dict[str, tuple[str, ...]] | None = None,
+) -> str:
     """
     Turn occurrences of other English titles into <$link> widgets:
 
@@ -155,34 +335,64 @@ def autolink_en(text: str, en_titles, current_title: str) -> str:
     We **do not** link:
       - the current tiddler's own title, even with small spelling variants
         (Six-Dynasties vs Six Dynasties)
+
+    Titles are prefiltered by their first word, then matched in a single
+    pass, so a shorter title is never linked inside a longer one that was
+    already matched. Callers linking many texts against the same titles
+    can pass by_word from _en_titles_by_first_word() to skip the lookup.
     """
     if not text:
         return text
 
-    current_norm = normalize_for_compare(current_title)
+    # Only titles whose first word occurs in the text can match at all;
+    # most articles mention a handful, so the regex stays small.
+    if by_word is None:
+        by_word = _en_titles_by_first_word(tuple(en_titles))
+    words = set(_word_re.findall(text))
+    candidates = [t for w in words & by_word.keys() for t in by_word[w]]
+    candidates.extend(by_word.get("", ()))
+    if not candidates:
+        return text
 
-    for t in en_titles:
-        # Skip exact string match
-        if t == current_title:
-            continue
+    pattern = _en_title_matcher(tuple(sorted(candidates)))
+    if pattern is None:
+        return text
 
-        # Skip titles that normalise to the same thing as this page's title
-        # (prevents an article about "Six Dynasties"/"Six-Dynasty" from
-        #  linking that phrase to a separate tiddler).
-        if normalize_for_compare(t) == current_norm:
-            continue
+    current_norm = normalize_for_compare(current_title)
 
-        # Match whole words, avoiding anything that is already part of [[...]]
-        pattern = r'(?<!\[)\b' + re.escape(t) + r'\b(?!\])'
+    def _repl(m: re.Match) -> str:
+        t = m.group(0)
+        # Skip exact string match, and titles that normalise to the same
+        # thing as this page's title (prevents an article about "Six
+        # Dynasties"/"Six-Dynasty" from linking that phrase to a separate
+        # tiddler).
+        if t == current_title or normalize_for_compare(t) == current_norm:
+            return t
+        return f'<$link to="{t}">{t}</$link>'
 
-        def _repl(m: re.Match) -> str:
-            visible = m.group(0)
-            return f'<$link to="{t}">{visible}</$link>'
+    return pattern.sub(_repl, text)
 
-        text = re.sub(pattern, _repl, text)
 
-    return text
 
+# Chinese counterpart of _en_title_matcher(): existing <$link> blocks
+# (group 1) are matched first so they are skipped as a whole, then every
+# phrase in one alternation (group 2), longest first. Returns the pattern
+# and a phrase -> canonical title map (first entry wins for duplicates).
+@lru_cache(maxsize=8)
+def _zh_title_matcher(zh_titles: tuple[tuple[str, str], ...]):
+    targets: dict[str, str] = {}
+    for phrase, canon_title in zh_titles:
+        if phrase:
+            targets.setdefault(phrase, canon_title)
+    if not targets:
+        return None, targets
+    alternation = "|".join(
+        re.escape(p) for p in sorted(targets, key=len, reverse=True)
+    )
+    pattern = re.compile(
+        r"(<\$link\b[^>]*>.*?</\$link>)|(" + alternation + ")", re.DOTALL
+    )
+    return pattern, targets
 
 
 def autolink_zh(
@@ -190,6 +400,8 @@ def autolink_zh(
     zh_titles,
     current_title: str,
     self_phrases: set[str] | None = None,
+    *,
+    matcher=None,
 ) -> str:
     """
     Turn occurrences of Chinese titles into <$link> widgets:
@@ -202,6 +414,10 @@ def autolink_zh(
         Chinese phrase as the label.
       - Skip linking phrases that belong to this tiddler (title or zh_title_*),
         to avoid self-links (e.g. 六朝 linking to itself in its own article).
+
+    All phrases are found in a single scan of the text. matcher is the
+    (pattern, targets) pair from _zh_title_matcher(); pass it when linking
+    many texts against the same titles.
     """
     if not text:
         return text
@@ -209,40 +425,22 @@ def autolink_zh(
     if self_phrases is None:
         self_phrases = set()
 
-    # We treat existing <$link ...>...</$link> as atomic.
-    link_pattern = re.compile(r"(<\$link\b[^>]*>.*?</\$link>)", re.DOTALL)
-
-    # IMPORTANT:
-    # We run per-phrase, and for *each* phrase we re-split the current text
-    # around existing <$link> blocks. That way, once we've created a link,
-    # later phrases never rewrite inside it.
-    for phrase, canon_title in zh_titles:
-        if not phrase:
-            continue
-        if phrase in self_phrases:
-            # don't link this page's own name(s)
-            continue
-        if phrase not in text:
-            # quick skip
-            continue
-
-        parts = link_pattern.split(text)
-        for i in range(0, len(parts), 2):
-            chunk = parts[i]
-            if not chunk or phrase not in chunk:
-                continue
-
-            # link TO the canonical title (usually English),
-            # but display the Chinese phrase as the label
-            chunk = chunk.replace(
-                phrase,
-                f'<$link to="{canon_title}">{phrase}</$link>',
-            )
-            parts[i] = chunk
+    if matcher is None:
+        matcher = _zh_title_matcher(tuple(zh_titles))
+    pattern, targets = matcher
+    if pattern is None:
+        return text
 
-        text = "".join(parts)
+    def _repl(m: re.Match) -> str:
+        phrase = m.group(2)
+        if phrase is None or phrase in self_phrases:
+            # existing link, or this page's own name(s): leave as is
+            return m.group(0)
+        # link TO the canonical title (usually English),
+        # but display the Chinese phrase as the label
+        return f'<$link to="{targets[phrase]}">{phrase}</$link>'
 
-    return text
+    return pattern.sub(_repl, text)
 
 
 
@@ -252,10 +450,11 @@ def autolink_zh(
 
 # create url-friendly for filenames
 _slug_re = re.compile(r"[^a-z0-9-_]")
+_dash_run_re = re.compile(r"-{2,}")
 def slugify(s: str) -> str:
     s = (s or "untitled").lower().strip().replace(" ", "-")
     s = _slug_re.sub("-", s)
-    return re.sub(r"-{2,}", "-", s)[:80]
+    return _dash_run_re.sub("-", s)[:80]
 
 def ensure_tw_project():
     """
@@ -270,7 +469,8 @@ def ensure_tw_project():
     if WIKI_WORKDIR.exists():
         shutil.rmtree(WIKI_WORKDIR)
 
-    (WIKI_WORKDIR / "tiddlers").mkdir(parents=True, exist_ok=True)
+    tiddlers_dir = WIKI_WORKDIR / "tiddlers"
+    tiddlers_dir.mkdir(parents=True, exist_ok=True)
 
     info = {
         "description": "Auto-generated wiki",
@@ -304,6 +504,184 @@ def ensure_tw_project():
         encoding="utf-8"
     )
     print("[publisher] Created fresh /tmp/wiki with tiddlywiki.info", flush=True)
+    return tiddlers_dir
+
+
+# Resolve the tiddlers directory for helpers that can be called standalone;
+# build_wiki() passes the directory ensure_tw_project() already created.
+def _resolve_tiddlers_dir(tiddlers_dir: Path | None) -> Path:
+    if tiddlers_dir is None:
+        tiddlers_dir = WIKI_WORKDIR / "tiddlers"
+        tiddlers_dir.mkdir(parents=True, exist_ok=True)
+    return tiddlers_dir
+
+
+# Homepage search scripts, written to SITE_DIR/output next to
+# summaries.json. search-core.js holds the matching logic and is loaded
+# both by the page (fallback) and by search-worker.js.
+SEARCH_CORE_JS = """
+// Homepage search index, shared by index.html and search-worker.js.
+// Generated by the publisher; edit publisher/app.py instead.
+
+// Older summaries.json files have no pre-lowercased fields; fill them in
+// once here so the keystroke loop never lowercases.
+function normalizeSummaries(arr) {
+    if (!Array.isArray(arr)) return [];
+    for (const t of arr) {
+        if (t.title_lc === undefined) t.title_lc = (t.title || "").toLowerCase();
+        if (t.summary_lc === undefined) t.summary_lc = (t.summary || "").toLowerCase();
+    }
+    return arr;
+}
+
+function createSearchIndex(entries) {
+    // Query -> matches cache. Matches for a longer query are always a subset
+    // of the matches for its prefix, so typing "nanj" -> "nanji" only rescans
+    // the previous matches; the small LRU makes backspacing free as well.
+    const QUERY_CACHE_MAX = 32;
+    const queryCache = new Map();
+    let lastQuery = "";
+    let lastFiltered = [];
+
+    // Subindex: once the query is SUBINDEX_MIN_LEN chars long, its matches
+    // become the corpus for every later query that keeps that prefix, even
+    // when the characters after it are edited. Skipped for very broad
+    // prefixes so it stays small.
+    const SUBINDEX_MIN_LEN = 3;
+    const SUBINDEX_MAX = 500;
+    let subIndex = null;
+    let subIndexPrefix = "";
+
+    function cacheResult(q, arr){
+        queryCache.delete(q);
+        queryCache.set(q, arr);
+        if(queryCache.size > QUERY_CACHE_MAX){
+            queryCache.delete(queryCache.keys().next().value);
+        }
+    }
+
+    function matchesFor(q){
+        const hit = queryCache.get(q);
+        if(hit){
+            cacheResult(q, hit);
+            return hit;
+        }
+        if(subIndex && !q.startsWith(subIndexPrefix)){
+            console.debug("[search] prefix changed, back to full scan");
+            subIndex = null;
+            subIndexPrefix = "";
+        }
+        let source = entries;
+        if(lastQuery && q.startsWith(lastQuery)){
+            source = lastFiltered;
+        } else if(subIndex){
+            source = subIndex;
+        }
+
+        // Exact substring match (title OR summary), on the lowercased
+        // copies generate_summaries_output() writes. A plain loop avoids
+        // the per-call closure; it is not capped at the display limit
+        // because the full match list is what later keystrokes narrow.
+        const out = [];
+        for(let i = 0, n = source.length; i < n; i++){
+            const t = source[i];
+            if(t.title_lc.indexOf(q) !== -1 || t.summary_lc.indexOf(q) !== -1){
+                out.push(t);
+            }
+        }
+        cacheResult(q, out);
+
+        if(!subIndex && q.length >= SUBINDEX_MIN_LEN && out.length <= SUBINDEX_MAX){
+            subIndex = out;
+            subIndexPrefix = q;
+        }
+        return out;
+    }
+
+    return {
+        // q must already be trimmed and lowercased
+        query(q) {
+            if(!q){
+                lastQuery = "";
+                return [];
+            }
+            const out = matchesFor(q);
+            lastQuery = q;
+            lastFiltered = out;
+            return out;
+        }
+    };
+}
+"""
+
+SEARCH_WORKER_JS = """
+// Homepage search worker: keeps the summaries index off the main thread.
+// Generated by the publisher; edit publisher/app.py instead.
+//
+//   {type: "init", url}      load summaries.json (relative to this file)
+//   {type: "query", q, seq}  -> {type: "results", seq, total, items}
+importScripts("search-core.js");
+
+const MAX_RESULTS = 200;
+let ready = null;
+
+async function load(url) {
+    try {
+        const res = await fetch(url);
+        const arr = res.ok ? await res.json() : [];
+        return createSearchIndex(normalizeSummaries(arr));
+    } catch (err) {
+        console.warn("Failed to load summaries:", err);
+        return createSearchIndex([]);
+    }
+}
+
+self.onmessage = async e => {
+    const msg = e.data || {};
+    if(msg.type === "init"){
+        ready = ready || load(msg.url || "summaries.json");
+        return;
+    }
+    if(msg.type === "query"){
+        ready = ready || load("summaries.json");
+        const index = await ready;
+        const matches = index.query(msg.q || "");
+        self.postMessage({
+            type: "results",
+            seq: msg.seq,
+            total: matches.length,
+            items: matches.slice(0, MAX_RESULTS).map(t => ({title: t.title})),
+        });
+    }
+};
+"""
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write data to path unless the file already holds exactly these bytes.
+    Leaving unchanged files alone keeps their mtime (and the HTTP caches
+    keyed on it) valid across republishes. Returns True if it wrote.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# homepage scripts in SITE_DIR/output; build_wiki() leaves them in place
+# when it clears the old wiki output, so unchanged ones keep their mtime
+SEARCH_SCRIPT_NAMES = frozenset(("search-core.js", "search-worker.js"))
+
+
+def write_search_scripts():
+    out = SITE_DIR / "output"
+    out.mkdir(parents=True, exist_ok=True)
+    write_if_changed(out / "search-core.js", SEARCH_CORE_JS.lstrip().encode("utf-8"))
+    write_if_changed(out / "search-worker.js", SEARCH_WORKER_JS.lstrip().encode("utf-8"))
 
 
 # Create a homepage that leads to the wiki site using a search bar.
@@ -477,17 +855,17 @@ def create_homepage():
         <div id="results"></div>
     </div>
 </div>
+<script src="output/search-core.js"></script>
 <script>
 
 // Load summaries directly from a static file generated by the publisher:
-// output/summaries.json
+// output/summaries.json (only used when the search worker is unavailable)
 
 async function loadSummaries() {
     try {
         const res = await fetch("output/summaries.json");
         if (!res.ok) return [];
-        const arr = await res.json();
-        return Array.isArray(arr) ? arr : [];
+        return normalizeSummaries(await res.json());
     } catch (err) {
         console.warn("Failed to load summaries:", err);
         return [];
@@ -495,7 +873,6 @@ async function loadSummaries() {
 }
 
 //UI + exact-match search behavior
-let TIDDLERS = [];
 let filtered = [];
 let activeIndex = -1;
 
@@ -504,30 +881,57 @@ const results = document.getElementById("results");
 const openBtn = document.getElementById("openBtn");
 
 
-function render() {
-    results.innerHTML = "";
+// Result rows are pooled: render() reuses the same <div>s, only touching
+// text and the active class, and hides leftovers instead of rebuilding the
+// list on every keystroke. At most MAX_RESULTS rows are shown.
+const MAX_RESULTS = 200;
+const itemPool = [];
+let shown = 0;
+
+const noResultsEl = document.createElement("div");
+noResultsEl.className = "no-results";
+noResultsEl.textContent = "No results found";
+noResultsEl.style.display = "none";
+results.appendChild(noResultsEl);
+
+function createItem(idx) {
+    const div = document.createElement("div");
+    div.className = "result-item";
+    div.dataset.idx = idx;
+    div.addEventListener("click", () => select(Number(div.dataset.idx)));
+    return div;
+}
 
+function render() {
     if(!input.value.trim()){
         results.style.display = "none";
         return;
     }
 
-    if(filtered.length === 0){
-        results.innerHTML = "<div class='no-results'>No results found</div>";
-        results.style.display = "block";
-        return;
-    }
+    const count = Math.min(filtered.length, MAX_RESULTS);
+    noResultsEl.style.display = count === 0 ? "" : "none";
 
-    filtered.forEach((t, idx) => {
-        const div = document.createElement("div");
-        div.className = "result-item" + (idx === activeIndex ? " active" : "");
-        div.textContent = t.title;
-        div.addEventListener("click", () => select(idx));
-        results.appendChild(div);
-    });
+    const fresh = document.createDocumentFragment();
+    for(let i = 0; i < count; i++){
+        let div = itemPool[i];
+        if(!div){
+            div = createItem(i);
+            itemPool.push(div);
+            fresh.appendChild(div);
+        }
+        const title = filtered[i].title;
+        if(div.textContent !== title) div.textContent = title;
+        div.classList.toggle("active", i === activeIndex);
+        div.style.display = "";
+    }
+    if(fresh.childNodes.length) results.appendChild(fresh);
+    for(let i = count; i < shown; i++){
+        itemPool[i].style.display = "none";
+    }
+    shown = count;
 
     results.style.display = "block";
-    openBtn.classList.remove("hidden");
+    if(count) openBtn.classList.remove("hidden");
 }
 
 function select(idx) {
@@ -536,44 +940,109 @@ function select(idx) {
     window.location.href = `output/index.html#${encoded}`;
 }
 
-input.addEventListener("input", () => {
-    const q = input.value.trim().toLowerCase();
+// Matching runs in output/search-worker.js so typing never waits on the
+// filter; without Worker support (or if it fails to start) the same
+// search-core.js index runs in the page instead.
+let worker = null;
+let localIndex = null;
+let querySeq = 0;        // id of the latest query sent
+let appliedSeq = 0;      // id of the results currently shown
+let selectWhenReady = false;
+
+function startLocalSearch() {
+    if(localIndex) return;
+    localIndex = createSearchIndex([]);
+    loadSummaries().then(arr => { localIndex = createSearchIndex(arr); });
+}
+
+function applyResults(seq, items) {
+    appliedSeq = seq;
+    filtered = items;
     activeIndex = 0;
+    render();
+    if(selectWhenReady){
+        selectWhenReady = false;
+        if(filtered.length) select(activeIndex);
+    }
+}
 
-    if(!q){
-        filtered = [];
-        render();
-        return;
+if(window.Worker){
+    try {
+        worker = new Worker("output/search-worker.js");
+        worker.onmessage = e => {
+            const msg = e.data || {};
+            // drop answers to queries the user has already typed past
+            if(msg.type === "results" && msg.seq === querySeq){
+                applyResults(msg.seq, msg.items);
+            }
+        };
+        worker.onerror = err => {
+            console.warn("Search worker failed; searching in page:", err);
+            worker = null;
+            startLocalSearch();
+            doFilterAndRender();
+        };
+        worker.postMessage({type: "init", url: "summaries.json"});
+    } catch (err) {
+        worker = null;
     }
+}
+if(!worker) startLocalSearch();
 
-    // Exact substring match (title OR summary)
-    filtered = TIDDLERS.filter(t => {
-        const title = (t.title || "").toLowerCase();
-        const summary = (t.summary || "").toLowerCase();
+// Coalesce bursts of keystrokes: at most one query per frame, always
+// reading the latest input value.
+let filterPending = false;
 
-        return title.includes(q) || summary.includes(q);
+input.addEventListener("input", () => {
+    if(filterPending) return;
+    filterPending = true;
+    requestAnimationFrame(() => {
+        if(!filterPending) return;  // already flushed by keydown
+        filterPending = false;
+        doFilterAndRender();
     });
-    render();
 });
 
+function doFilterAndRender() {
+    const q = input.value.trim().toLowerCase();
+    const seq = ++querySeq;
+
+    if(worker){
+        worker.postMessage({type: "query", q: q, seq: seq});
+        return;
+    }
+    applyResults(seq, localIndex.query(q).slice(0, MAX_RESULTS));
+}
+
 input.addEventListener("keydown", e => {
     if(!["ArrowDown","ArrowUp","Enter","Escape"].includes(e.key)) return;
 
+    // a query still queued for the next frame must be sent before we act
+    if(filterPending){
+        filterPending = false;
+        doFilterAndRender();
+    }
+
     if(e.key === "ArrowDown"){
         e.preventDefault();
-        if(filtered.length === 0) return;
-        activeIndex = Math.min(activeIndex + 1, filtered.length - 1);
+        if(shown === 0) return;
+        activeIndex = Math.min(activeIndex + 1, shown - 1);
         highlightScroll();
     }
     if(e.key === "ArrowUp"){
         e.preventDefault();
-        if(filtered.length === 0) return;
+        if(shown === 0) return;
         activeIndex = Math.max(activeIndex - 1, 0);
         highlightScroll();
     }
     if(e.key === "Enter"){
         e.preventDefault();
-        if(activeIndex >= 0 && filtered.length) select(activeIndex);
+        if(appliedSeq !== querySeq){
+            // results for what was typed are still on their way
+            selectWhenReady = true;
+        } else if(activeIndex >= 0 && filtered.length){
+            select(activeIndex);
+        }
     }
     if(e.key === "Escape"){
         results.style.display = "none";
@@ -581,11 +1050,10 @@ input.addEventListener("keydown", e => {
 });
 
 function highlightScroll(){
-    const items = results.children;
-    for(let i = 0; i < items.length; i++){
-        items[i].classList.toggle("active", i === activeIndex);
+    for(let i = 0; i < shown; i++){
+        itemPool[i].classList.toggle("active", i === activeIndex);
     }
-    const el = items[activeIndex];
+    const el = activeIndex < shown ? itemPool[activeIndex] : null;
     if(el) el.scrollIntoView({block: "nearest"});
 }
 
@@ -604,18 +1072,17 @@ document.addEventListener("click", ev => {
     }
 });
 
-// Start loading summaries from static file
-(async () => {
-    TIDDLERS = await loadSummaries();
-})();
-
 </script>
 
 </body>
 </html>
 """
-    (SITE_DIR / "index.html").write_text(html, encoding="utf-8")
-    print("[publisher] Created homepage with search function.")
+    # the page is static; a republish with no template change leaves it be
+    if write_if_changed(SITE_DIR / "index.html", html.encode("utf-8")):
+        print("[publisher] Created homepage with search function.")
+    else:
+        print("[publisher] Homepage unchanged; left as is.")
+    write_search_scripts()
 
 # Plugin for use with homepage, opens advance search to find tiddler.
 def inject_search_handler():
@@ -670,16 +1137,24 @@ exports.startup = function() {
     print("[publisher] Injected external search handler", flush=True)
 
 # HELPERS FOR LANGUAGE HEURISTICS AND TITLE DERIVATION
+_cjk_re = re.compile(r"[\u4e00-\u9fff]")
+_bracketed_title_re = re.compile(r"^\[\[(.+?)\]\]$")
+_title_break_re = re.compile(r"^(.+?)(?:\s+is\b|\s+was\b|,|\.)")
+
+
+# the same titles and summaries are checked in both create_tiddlers passes
+# and again by build_title_index()
+@lru_cache(maxsize=8192)
 def looks_like_chinese(text: str) -> bool:   
     """Return True if text looks like it's mostly CJK characters."""  
-    if not text:                                                     
-        return False                                                 
-    cjk = 0                                                          
-    for ch in text:                                                  
-        if "\u4e00" <= ch <= "\u9fff":                               
-            cjk += 1                                                 
+    # fewer than 4 chars can never reach the 4-CJK-char threshold, and
+    # pure ASCII (most English summaries) has no CJK at all
+    if not text or len(text) < 4 or text.isascii():
+        return False
+    # counted by the regex engine instead of a per-char Python loop
+    cjk = len(_cjk_re.findall(text))
     # "mostly Chinese" = at least 4 CJK chars and > 25% of all chars  
-    return cjk >= 4 and cjk > len(text) / 4.0                        
+    return cjk >= 4 and cjk * 4 > len(text)
 
 
 def derive_english_title_from_summary(en_summary: str) -> str | None:  
@@ -690,7 +1165,7 @@ def derive_english_title_from_summary(en_summary: str) -> str | None:
         return None                                                     
     text = en_summary.strip()                                           
     # Look for '... is', '... was', comma, or period as a first break   
-    m = re.match(r"^(.+?)(?:\s+is\b|\s+was\b|,|\.)", text)              
+    m = _title_break_re.match(text)
     if m:                                                               
         candidate = m.group(1).strip()                                  
     else:                                                               
@@ -700,8 +1175,265 @@ def derive_english_title_from_summary(en_summary: str) -> str | None:
     return candidate                                                    
 
 
+def _unbracket(raw: str) -> str:
+    """Strip surrounding whitespace and a whole-string [[...]] wrapper."""
+    raw = raw.strip()
+    m = _bracketed_title_re.match(raw)
+    return m.group(1).strip() if m else raw
+
+
+# opening line of each language block in a tiddler body
+_LANG_LIST_OPEN = {
+    lang: f'<$list filter="[[$:/state/wiki-language]get[text]match[{lang}]]">'
+    for lang in ("en", "zh-hans", "zh-hant")
+}
+
+
+def _render_tiddler(
+    topic_key: str,
+    entry: dict,
+    en_titles,
+    zh_titles,
+    en_by_word,
+    zh_matcher,
+    created: str,
+) -> tuple[str, bytes, list[str]]:
+    """
+    Render one topic chosen by create_tiddlers() into (filename, .tid bytes,
+    log lines). The log lines are printed by the caller, so they come out in
+    topic order even when topics are rendered in worker processes.
+    """
+    data = entry["data"]
+    notes: list[str] = []
+
+    # titles were already normalised (and zh-Hant defaulted) in pass 1
+    title = entry["title"]
+    if title is None:
+        title = _unbracket(topic_key)
+    zh_title_hans = entry["zh_title_hans"]
+    zh_title_hant = entry["zh_title_hant"]
+
+    # Build a set of phrases that belong to THIS tiddler,
+    # so we don't autolink them in its own body (self-links).
+    self_phrases: set[str] = set()
+    if looks_like_chinese(title):
+        self_phrases.add(title)
+    if zh_title_hans:
+        self_phrases.add(zh_title_hans)
+    if zh_title_hant:
+        self_phrases.add(zh_title_hant)
+
+
+    # SPECIAL CASE: tunnel topic canonicalisation  
+    if topic_key == "Nanjing Yingtian Avenue Yangtze River Tunnel":
+        title = "Nanjing Yingtian Avenue Yangtze River Tunnel"
+        if not zh_title_hans:
+            zh_title_hans = "南京应天大街长江隧道"
+        if not zh_title_hant:
+            zh_title_hant = "南京應天大街長江隧道"
+
+    # SUMMARIES  
+    en_summary   = (data.get("summary_en") or "").strip()
+    hans_summary = (data.get("summary_zh_hans") or "").strip()
+    hant_summary = (data.get("summary_zh_hant") or "").strip()
+
+    # strip raw wiki [[...]] markup from summaries so it
+    # doesn't create visible brackets or broken internal links.
+    en_summary   = strip_wikilinks_markup(en_summary)
+    hans_summary = strip_wikilinks_markup(hans_summary)
+    hant_summary = strip_wikilinks_markup(hant_summary)
+    
+
+    # If "English" summary is actually Chinese, treat it as missing    
+    if en_summary and looks_like_chinese(en_summary):                  
+        notes.append(f"[publisher] summary_en looks Chinese for '{title}', disabling English body")
+        en_summary = ""                                                
+
+    # If title is Chinese-looking but we now have an English summary,
+    # derive an English title from the summary (e.g. the station case).   
+    if looks_like_chinese(title) and en_summary:                       
+        derived = derive_english_title_from_summary(en_summary)        
+        if derived:                                                    
+            notes.append(
+                f"[publisher] Using derived English title '{derived}' "
+                f"for topic '{topic_key}' (was '{title}')"
+            )
+            title = derived
+                                 
+
+    # INTERNAL AUTOLINKING 
+
+    en_linked   = autolink_en(en_summary,   en_titles, title, by_word=en_by_word)
+    hans_linked = autolink_zh(hans_summary, zh_titles, title, self_phrases, matcher=zh_matcher)
+    hant_linked = autolink_zh(hant_summary, zh_titles, title, self_phrases, matcher=zh_matcher)
+
+
+
+    # Mark if this article actually has usable English content
+    has_en = "yes" if en_summary else "no"    
+
+    # pull timing metadata from summarizer output
+    retrieved_at = (data.get("retrieved_at") or "").strip()
+    last_summarized_at = (data.get("last_summarized_at") or "").strip()
+                             
+
+    # Language-aware body: EN / zh-Hans / zh-Hant
+    body = "\n".join((
+        _LANG_LIST_OPEN["en"], en_linked, "</$list>",
+        "",
+        _LANG_LIST_OPEN["zh-hans"], hans_linked, "</$list>",
+        "",
+        _LANG_LIST_OPEN["zh-hant"], hant_linked, "</$list>",
+    ))
+
+    # At this point any legitimate links we created are <$link> widgets.
+    # So any leftover [[...]] is raw Wikipedia markup. Strip it down
+    # to just its visible label (last part after '|').
+    #body = strip_wikilinks_markup(body)    
+
+    # as a final safety net, collapse any nested wiki-links
+    # that might still exist in the combined body, e.g. [[[[Foo]]]]
+    # → [[Foo]]. TiddlyWiki will then render them as normal links.
+    body = squash_nested_wikilinks(body)
+    
+
+    # NOTE: we do NOT fall back to generic text here, because that      
+    # might be Chinese; when language=English and en_summary is empty
+    # we prefer to show nothing over showing Chinese text by mistake.
+
+    # TAGS (drop 'summary' + empties)  
+    raw_tags = data.get("tags") or []
+    tags = [t for t in raw_tags if (t or "") not in _SKIP_TAGS]
+    tagstr = " ".join(tags)
+
+    # SOURCES  
+    en_source = (data.get("url") or "").strip()
+    zh_source = (data.get("zh_url") or "").strip()
+
+    sid     = hashlib.blake2b(title.encode("utf-8"), digest_size=4).hexdigest()
+    fname   = f"{slugify(title)}-{sid}.tid"
+
+    source_parts = []
+    if en_source:
+        source_parts.append(f"[[{en_source}]]")
+    if zh_source and (hans_summary or hant_summary):
+        source_parts.append(f"[[{zh_source}]]")
+    source_line = "source: " + (" ; ".join(source_parts) if source_parts else "unknown")
+
+    # After all title adjustments, decide which script the *final* title
+    # uses. This powers language-aware lists (Recent, More → All).
+    # compute title_script here, not earlier.
+    is_title_chinese = looks_like_chinese(title)
+    title_script = "zh" if is_title_chinese else "en"
+
+
+    # HEADER FIELDS  
+    header_lines = [
+        f"title: {title}",
+        f"tags: {tagstr}",
+        "type: text/vnd.tiddlywiki",
+        f"created: {created}",
+        f"modified: {created}",
+        f"has_en: {has_en}",
+        f"title_script: {title_script}", 
+    ]
+    if zh_title_hans:
+        header_lines.append(f"zh_title_hans: {zh_title_hans}")
+    if zh_title_hant:
+        header_lines.append(f"zh_title_hant: {zh_title_hant}")
+    if retrieved_at:
+        header_lines.append(f"retrieved_at: {retrieved_at}")
+    if last_summarized_at:
+        header_lines.append(f"last_summarized_at: {last_summarized_at}")
+
+    header = "\n".join(header_lines)
+
+    # visible metadata footer inside the tiddler body
+    meta_parts = []
+    if retrieved_at:
+        meta_parts.append(f"retrieved: {retrieved_at}")
+    if last_summarized_at:
+        meta_parts.append(f"summarized: {last_summarized_at}")
+    meta_line = "meta: " + " ; ".join(meta_parts) if meta_parts else ""
+    
+
+    tid = f"{header}\n\n{body}\n\n{source_line}\n"
+    # encode once and skip the text-mode wrapper
+    return fname, tid.encode("utf-8"), notes
+
+
+# autolink context of a render worker process, set by _init_render_worker()
+_render_ctx = None
+
+
+def _init_render_worker(en_titles, zh_titles, created: str) -> None:
+    global _render_ctx
+    _render_ctx = (
+        en_titles,
+        zh_titles,
+        _en_titles_by_first_word(tuple(en_titles)),
+        _zh_title_matcher(tuple(zh_titles)),
+        created,
+    )
+
+
+def _render_in_process(topic_key, entry, *ctx):
+    """Returns (fname, payload, notes, None), or (None, None, [], error) on failure."""
+    try:
+        return (*_render_tiddler(topic_key, entry, *ctx), None)
+    except Exception as e:
+        # a string pickles back from a worker whatever the exception type
+        return None, None, [], str(e)
+
+
+def _render_in_worker(item):
+    topic_key, entry = item
+    return _render_in_process(topic_key, entry, *_render_ctx)
+
+
+def _render_all(items, en_titles, zh_titles, created):
+    """
+    Yield _render_in_process() results for items, in order. Large builds
+    render on a process pool; if the pool can't start or a worker dies,
+    the remaining topics are rendered in this process instead.
+    """
+    done = 0
+    if PUBLISHER_WORKERS > 1 and len(items) >= PARALLEL_RENDER_MIN_TOPICS:
+        # rendering is pure CPU work with no shared state; the titles and
+        # matchers are sent to each worker once by the initializer
+        try:
+            with ProcessPoolExecutor(
+                max_workers=PUBLISHER_WORKERS,
+                initializer=_init_render_worker,
+                initargs=(en_titles, zh_titles, created),
+            ) as pool:
+                for result in pool.map(_render_in_worker, items, chunksize=64):
+                    yield result
+                    done += 1
+        except (BrokenProcessPool, OSError) as e:
+            print(
+                f"[WARN] render pool failed ({e}); rendering the remaining "
+                f"{len(items) - done} topics in-process",
+                flush=True,
+            )
+    if done == len(items):
+        return
+
+    # autolink lookups depend only on the title sets; build them once
+    # instead of converting and hashing the full title lists per call
+    en_by_word = _en_titles_by_first_word(tuple(en_titles))
+    zh_matcher = _zh_title_matcher(tuple(zh_titles))
+    for topic_key, entry in items[done:]:
+        yield _render_in_process(topic_key, entry, en_titles, zh_titles, en_by_word, zh_matcher, created)
+
+
 # create tiddlers from JSON summaries, build .tid files
-def create_tiddlers(en_titles, zh_titles) -> int:
+def create_tiddlers(
+    en_titles,
+    zh_titles,
+    tiddlers_dir: Path | None = None,
+    summaries: list[tuple[Path, dict]] | None = None,
+) -> int:
     """
     Read all summarized JSON files and turn them into .tid tiddlers.
 
@@ -715,35 +1447,20 @@ def create_tiddlers(en_titles, zh_titles) -> int:
          - If summary_en is actually Chinese, we treat it as missing
            for English so there is NO Chinese body when language=English.
     """
-    tiddlers_dir = WIKI_WORKDIR / "tiddlers"
-    tiddlers_dir.mkdir(parents=True, exist_ok=True)
+    tiddlers_dir = _resolve_tiddlers_dir(tiddlers_dir)
 
     # FIRST PASS — choose ONE best JSON per topic                        
-    topics = {}  # topics[topic_key] = {"data": <json dict>, "json_name": "..."}   
-
-    for json_path in Path(SUMMARY_DIR).glob("*.json"):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8-sig"))
-        except Exception as e:
-            print(f"[WARN] failed to read {json_path.name}: {e}", flush=True)
-            continue
-
-        # Normalize base title (remove [[ ]] if present)
-        raw_title = (data.get("title") or json_path.stem).strip()
-        m = re.match(r"^\[\[(.+?)\]\]$", raw_title)
-        if m:
-            title = m.group(1).strip()
-        else:
-            title = raw_title
-
-        # Normalize Chinese titles (strip [[ ]] if present)
-        raw_zh_hans = (data.get("zh_title_hans") or "").strip()
-        m_hans = re.match(r"^\[\[(.+?)\]\]$", raw_zh_hans)
-        zh_title_hans = m_hans.group(1).strip() if m_hans else raw_zh_hans
-
-        raw_zh_hant = (data.get("zh_title_hant") or "").strip()
-        m_hant = re.match(r"^\[\[(.+?)\]\]$", raw_zh_hant)
-        zh_title_hant = m_hant.group(1).strip() if m_hant else raw_zh_hant
+    # topics[topic_key] = {"data": <json dict>, "json_name": "...", plus the
+    # titles and has_en flag already normalised here so pass 2 reuses them}
+    topics = {}
+
+    if summaries is None:
+        summaries = load_all_summaries()
+    for json_path, data in summaries:
+        # Normalize base and Chinese titles (remove [[ ]] if present)
+        title = _unbracket(data.get("title") or json_path.stem)
+        zh_title_hans = _unbracket(data.get("zh_title_hans") or "")
+        zh_title_hant = _unbracket(data.get("zh_title_hant") or "")
 
         if zh_title_hans and not zh_title_hant:
             zh_title_hant = zh_title_hans
@@ -753,11 +1470,7 @@ def create_tiddlers(en_titles, zh_titles) -> int:
         # but keep the special tunnel canonicalisation override.
         topic_id = (data.get("topic_id") or "").strip()
 
-        if (
-            title in TUNNEL_TITLES
-            or zh_title_hans in TUNNEL_TITLES
-            or zh_title_hant in TUNNEL_TITLES
-        ):
+        if not TUNNEL_TITLES.isdisjoint((title, zh_title_hans, zh_title_hant)):
             topic_key = "Nanjing Yingtian Avenue Yangtze River Tunnel"
         elif zh_title_hans:
             topic_key = zh_title_hans
@@ -770,235 +1483,74 @@ def create_tiddlers(en_titles, zh_titles) -> int:
         raw_en_summary = (data.get("summary_en") or "").strip()               
         candidate_has_en = bool(raw_en_summary and not looks_like_chinese(raw_en_summary))   
 
+        candidate = {
+            "data": data,
+            "json_name": json_path.name,
+            # pass 2 falls back to the topic key, not the file stem,
+            # when the JSON has no title of its own
+            "title": title if data.get("title") else None,
+            "zh_title_hans": zh_title_hans,
+            "zh_title_hant": zh_title_hant,
+            "has_en": candidate_has_en,
+        }
+
         existing = topics.get(topic_key)
         if not existing:
             # First time we see this topic → keep it                           
-            topics[topic_key] = {
-                "data": data,
-                "json_name": json_path.name,
-            }
+            topics[topic_key] = candidate
         else:
             # Prefer a JSON that has real English summary_en                   
-            existing_raw_en = (existing["data"].get("summary_en") or "").strip()
-            existing_has_en = bool(existing_raw_en and not looks_like_chinese(existing_raw_en))
-            if not existing_has_en and candidate_has_en:
+            if not existing["has_en"] and candidate_has_en:
                 print(
                     f"[publisher] For topic '{topic_key}', "
                     f"preferring {json_path.name} (has English summary) "
                     f"over {existing['json_name']}",
                     flush=True,
                 )
-                topics[topic_key] = {
-                    "data": data,
-                    "json_name": json_path.name,
-                }
+                topics[topic_key] = candidate
             # else: keep existing                                              
 
     # SECOND PASS — actually write one tiddler per topic                  
     count = 0
 
-    for topic_key, entry in topics.items():
-        data = entry["data"]
-        json_name = entry["json_name"]
-
-        try:
-            # NORMALISE ENGLISH TITLE (strip [[ ]] if present) 
-            raw_title = (data.get("title") or topic_key).strip()
-            m = re.match(r"^\[\[(.+?)\]\]$", raw_title)
-            if m:
-                title = m.group(1).strip()
-            else:
-                title = raw_title
-
-            # NORMALISE CHINESE TITLES  
-            raw_zh_hans = (data.get("zh_title_hans") or "").strip()
-            m_hans = re.match(r"^\[\[(.+?)\]\]$", raw_zh_hans)
-            zh_title_hans = m_hans.group(1).strip() if m_hans else raw_zh_hans
-
-            raw_zh_hant = (data.get("zh_title_hant") or "").strip()
-            m_hant = re.match(r"^\[\[(.+?)\]\]$", raw_zh_hant)
-            zh_title_hant = m_hant.group(1).strip() if m_hant else raw_zh_hant
-
-            if zh_title_hans and not zh_title_hant:
-                zh_title_hant = zh_title_hans
-
-            # Build a set of phrases that belong to THIS tiddler,
-            # so we don't autolink them in its own body (self-links).
-            self_phrases: set[str] = set()
-            if looks_like_chinese(title):
-                self_phrases.add(title)
-            if zh_title_hans:
-                self_phrases.add(zh_title_hans)
-            if zh_title_hant:
-                self_phrases.add(zh_title_hant)
-
-
-            # SPECIAL CASE: tunnel topic canonicalisation  
-            if topic_key == "Nanjing Yingtian Avenue Yangtze River Tunnel":
-                title = "Nanjing Yingtian Avenue Yangtze River Tunnel"
-                if not zh_title_hans:
-                    zh_title_hans = "南京应天大街长江隧道"
-                if not zh_title_hant:
-                    zh_title_hant = "南京應天大街長江隧道"
-
-            # SUMMARIES  
-            en_summary   = (data.get("summary_en") or "").strip()
-            hans_summary = (data.get("summary_zh_hans") or "").strip()
-            hant_summary = (data.get("summary_zh_hant") or "").strip()
-
-            # strip raw wiki [[...]] markup from summaries so it
-            # doesn't create visible brackets or broken internal links.
-            en_summary   = strip_wikilinks_markup(en_summary)
-            hans_summary = strip_wikilinks_markup(hans_summary)
-            hant_summary = strip_wikilinks_markup(hant_summary)
-            
-
-            # If "English" summary is actually Chinese, treat it as missing    
-            if en_summary and looks_like_chinese(en_summary):                  
-                print(f"[publisher] summary_en looks Chinese for '{title}', disabling English body", flush=True)   
-                en_summary = ""                                                
-
-            # If title is Chinese-looking but we now have an English summary,
-            # derive an English title from the summary (e.g. the station case).   
-            if looks_like_chinese(title) and en_summary:                       
-                derived = derive_english_title_from_summary(en_summary)        
-                if derived:                                                    
-                    print(
-                        f"[publisher] Using derived English title '{derived}' "
-                        f"for topic '{topic_key}' (was '{title}')",
-                        flush=True,
-                    )
-                    title = derived
-                                         
-
-            # INTERNAL AUTOLINKING 
-
-            en_linked   = autolink_en(en_summary,   en_titles, title)
-            hans_linked = autolink_zh(hans_summary, zh_titles, title, self_phrases)
-            hant_linked = autolink_zh(hant_summary, zh_titles, title, self_phrases)
-
-
-
-            # Mark if this article actually has usable English content
-            has_en = "yes" if en_summary else "no"    
-
-            # pull timing metadata from summarizer output
-            retrieved_at = (data.get("retrieved_at") or "").strip()
-            last_summarized_at = (data.get("last_summarized_at") or "").strip()
-                                     
-
-            # Language-aware body: EN / zh-Hans / zh-Hant
-            body = textwrap.dedent(f"""
-<$list filter="[[$:/state/wiki-language]get[text]match[en]]">
-{en_linked}
-</$list>
-
-<$list filter="[[$:/state/wiki-language]get[text]match[zh-hans]]">
-{hans_linked}
-</$list>
-
-<$list filter="[[$:/state/wiki-language]get[text]match[zh-hant]]">
-{hant_linked}
-</$list>
-""").strip()
-
-            # At this point any legitimate links we created are <$link> widgets.
-            # So any leftover [[...]] is raw Wikipedia markup. Strip it down
-            # to just its visible label (last part after '|').
-            #body = strip_wikilinks_markup(body)    
-
-            # as a final safety net, collapse any nested wiki-links
-            # that might still exist in the combined body, e.g. [[[[Foo]]]]
-            # → [[Foo]]. TiddlyWiki will then render them as normal links.
-            body = squash_nested_wikilinks(body)
-            
-
-            # NOTE: we do NOT fall back to generic text here, because that      
-            # might be Chinese; when language=English and en_summary is empty
-            # we prefer to show nothing over showing Chinese text by mistake.
-
-            # TAGS (drop 'summary' + empties)  
-            raw_tags = data.get("tags") or []
-            tags = [t for t in raw_tags if t and t != "summary"]
-            tagstr = " ".join(tags)
-
-            # SOURCES  
-            en_source = (data.get("url") or "").strip()
-            zh_source = (data.get("zh_url") or "").strip()
-
-            created = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-            sid     = hashlib.sha1(title.encode("utf-8")).hexdigest()[:8]
-            fname   = f"{slugify(title)}-{sid}.tid"
-
-            source_parts = []
-            if en_source:
-                source_parts.append(f"[[{en_source}]]")
-            if zh_source and (hans_summary or hant_summary):
-                source_parts.append(f"[[{zh_source}]]")
-            source_line = "source: " + (" ; ".join(source_parts) if source_parts else "unknown")
-
-            # After all title adjustments, decide which script the *final* title
-            # uses. This powers language-aware lists (Recent, More → All).
-            # compute title_script here, not earlier.
-            is_title_chinese = looks_like_chinese(title)
-            title_script = "zh" if is_title_chinese else "en"
-
-
-            # HEADER FIELDS  
-            header_lines = [
-                f"title: {title}",
-                f"tags: {tagstr}",
-                "type: text/vnd.tiddlywiki",
-                f"created: {created}",
-                f"modified: {created}",
-                f"has_en: {has_en}",
-                f"title_script: {title_script}", 
-            ]
-            if zh_title_hans:
-                header_lines.append(f"zh_title_hans: {zh_title_hans}")
-            if zh_title_hant:
-                header_lines.append(f"zh_title_hant: {zh_title_hant}")
-            if retrieved_at:
-                header_lines.append(f"retrieved_at: {retrieved_at}")
-            if last_summarized_at:
-                header_lines.append(f"last_summarized_at: {last_summarized_at}")
-
-            header = "\n".join(header_lines)
-
-            # visible metadata footer inside the tiddler body
-            meta_parts = []
-            if retrieved_at:
-                meta_parts.append(f"retrieved: {retrieved_at}")
-            if last_summarized_at:
-                meta_parts.append(f"summarized: {last_summarized_at}")
-            meta_line = "meta: " + " ; ".join(meta_parts) if meta_parts else ""
-            
-
-            tid = f"{header}\n\n{body}\n\n{source_line}\n"
-
-            (tiddlers_dir / fname).write_text(tid, encoding="utf-8")
-            count += 1
-
-        except Exception as e:
-            print(f"[WARN] failed {json_name} for topic '{topic_key}': {e}", flush=True)
+    # every tiddler of one build shares the build time
+    created = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+
+    items = list(topics.items())
+    results = _render_all(items, en_titles, zh_titles, created)
+    for (topic_key, entry), (fname, payload, notes, error) in zip(items, results):
+        for note in notes:
+            print(note, flush=True)
+        if error is None:
+            try:
+                (tiddlers_dir / fname).write_bytes(payload)
+                count += 1
+                continue
+            except Exception as e:
+                error = e
+        print(f"[WARN] failed {entry['json_name']} for topic '{topic_key}': {error}", flush=True)
 
+    # the cache holds whole summaries; don't keep them past the build
+    looks_like_chinese.cache_clear()
     print(f"[publisher] Created {count} tiddlers from {SUMMARY_DIR}")
     return count
 
 
 # Generate a single static summaries file for the homepage to load directly
-def generate_summaries_output():
+def generate_summaries_output(summaries: list[tuple[Path, dict]] | None = None):
+    if summaries is None:
+        summaries = load_all_summaries()
     entries = []
-    for f in SUMMARY_DIR.glob("*.json"):
-        if not f.is_file():
-            continue
+    for f, data in summaries:
         try:
-            data = json.loads(f.read_text(encoding="utf-8-sig"))
             title = data.get("title") or f.stem
             summary = data.get("summary_en") or data.get("summary") or ""
+            # the homepage only displays the title; search runs on the
+            # lowercased fields so it never lowercases per keystroke
             entries.append({
                 "title": title,
-                "summary": summary
+                "title_lc": title.lower(),
+                "summary_lc": summary.lower(),
             })
         except Exception as e:
             print(f"[WARN] skipping {f.name}: {e}", flush=True)
@@ -1008,11 +1560,19 @@ def generate_summaries_output():
     out = SITE_DIR / "output"
     out.mkdir(parents=True, exist_ok=True)
     dest = out / "summaries.json"
-    dest.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding="utf-8")
+    # compact: the homepage only parses it, so indentation is wasted bytes
+    payload = json_dumps_bytes(entries)
+    dest.write_bytes(payload)
+    # pre-compressed copy for servers that serve *.gz siblings directly
+    # (e.g. nginx gzip_static); mtime=0 keeps it byte-identical across builds
+    (out / "summaries.json.gz").write_bytes(gzip.compress(payload, compresslevel=9, mtime=0))
 
     print(f"[publisher] Wrote summaries output to {dest} ({len(entries)} entries)")
 
-def create_tag_tiddlers():
+def create_tag_tiddlers(
+    tiddlers_dir: Path | None = None,
+    summaries: list[tuple[Path, dict]] | None = None,
+):
     """
     Create one Tag definition tiddler per Chinese tag.
 
@@ -1021,8 +1581,7 @@ def create_tag_tiddlers():
       - tags:    $:/tags/Tag    (so TW treats it as a tag)
       - fields:  caption-en, caption-zh-hans, caption-zh-hant
     """
-    tiddlers_dir = WIKI_WORKDIR / "tiddlers"
-    tiddlers_dir.mkdir(parents=True, exist_ok=True)
+    tiddlers_dir = _resolve_tiddlers_dir(tiddlers_dir)
 
     # Chinese tag -> (English label, Simplified, Traditional)
     TAG_LABELS = {
@@ -1060,14 +1619,12 @@ def create_tag_tiddlers():
 
     # Discover which tags actually appear in summarized JSON
     used_tags = set()
-    for json_path in SUMMARY_DIR.glob("*.json"):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8-sig"))
-        except Exception:
-            continue
+    if summaries is None:
+        summaries = load_all_summaries()
+    for _, data in summaries:
         for tag in data.get("tags") or []:
-            tag = (tag or "").strip()           
-            if not tag or tag == "summary":    
+            tag = (tag or "").strip()
+            if tag in _SKIP_TAGS:
                 continue
             used_tags.add(tag)
 
@@ -1102,7 +1659,7 @@ def create_tag_tiddlers():
         body = "<<lang-tag-caption>>"
 
         # Filename: hash the tag so we don't fight with non-ASCII and slashes
-        fname = f"__tag-{hashlib.sha1(tag.encode('utf-8')).hexdigest()[:8]}.tid"
+        fname = f"__tag-{hashlib.blake2b(tag.encode('utf-8'), digest_size=4).hexdigest()}.tid"
         tid_text = header + "\n\n" + body + "\n"
         (tiddlers_dir / fname).write_text(tid_text, encoding="utf-8")
         count += 1
@@ -1113,43 +1670,52 @@ def create_tag_tiddlers():
 # Create $:/SiteTitle and $:/SiteSubtitle tiddlers for Headings
 # Inject global language state and language switcher tiddlers,
 # so users can switch languages in the wiki UI.
-def inject_tiddlers():
-    tiddlers_dir = WIKI_WORKDIR / "tiddlers"
-    tiddlers_dir.mkdir(parents=True, exist_ok=True)
+def inject_tiddlers(tiddlers_dir: Path | None = None):
+    tiddlers_dir = _resolve_tiddlers_dir(tiddlers_dir)
+
+    # Per-language text variants, one tiny tiddler per (key, language):
+    #   $:/plugins/wiki/<key>/<lang>
+    # The UI tiddlers below pick the right one with a single lookup filter
+    # on $:/state/wiki-language instead of evaluating one $list/$reveal
+    # block per language on every render.
+    lang_variants = {
+        "site-title": {
+            "en": "Nanjing Knowledge Hub Wiki",
+            "zh-hans": "南京知识枢纽维基",
+            "zh-hant": "南京知識樞紐維基",
+        },
+        "site-subtitle": {
+            "en": "Nanjing Encyclopedia, with a strong duck flavor",
+            "zh-hans": "南京小百科，浓浓鸭子味儿",
+            "zh-hant": "南京小百科，濃濃鴨子味兒",
+        },
+        # which field holds the displayed page title
+        "title-field": {
+            "en": "title",
+            "zh-hans": "zh_title_hans",
+            "zh-hant": "zh_title_hant",
+        },
+        # date heading format for the Recent sidebar; English follows the
+        # TiddlyWiki language's own format instead (see recent_sidebar)
+        "date-format": {
+            "zh-hans": "YYYY年0MM月0DD日",
+            "zh-hant": "YYYY年0MM月0DD日",
+        },
+    }
 
     # Site title + subtitle (language aware) 
     site_title = textwrap.dedent("""
     title: $:/SiteTitle
     type: text/vnd.tiddlywiki
 
-    <$list filter="[[$:/state/wiki-language]get[text]match[zh-hans]]">
-    南京知识枢纽维基
-    </$list>
-
-    <$list filter="[[$:/state/wiki-language]get[text]match[zh-hant]]">
-    南京知識樞紐維基
-    </$list>
-
-    <$list filter="[[$:/state/wiki-language]get[text]match[en]]">
-    Nanjing Knowledge Hub Wiki
-    </$list>
+    <<lang-lookup "$:/plugins/wiki/site-title/">>
     """).strip()
 
     site_subtitle = textwrap.dedent("""
     title: $:/SiteSubtitle
     type: text/vnd.tiddlywiki
 
-    <$list filter="[[$:/state/wiki-language]get[text]match[zh-hans]]">
-    南京小百科，浓浓鸭子味儿
-    </$list>
-
-    <$list filter="[[$:/state/wiki-language]get[text]match[zh-hant]]">
-    南京小百科，濃濃鴨子味兒
-    </$list>
-
-    <$list filter="[[$:/state/wiki-language]get[text]match[en]]">
-    Nanjing Encyclopedia, with a strong duck flavor
-    </$list>
+    <<lang-lookup "$:/plugins/wiki/site-subtitle/">>
     """).strip()
 
     # language state + picker
@@ -1181,6 +1747,10 @@ def inject_tiddlers():
     tags: $:/tags/Macro
     type: text/vnd.tiddlywiki
 
+    \define lang-lookup(prefix)
+    <$text text={{{ [{$:/state/wiki-language}addprefix[$prefix$]get[text]] }}}/>
+    \end
+
     \define lang-caption()
     <$reveal type="match" state="$:/state/wiki-language" text="zh-hans">
       <$view field="zh_title_hans" default=<<view field "title">> />
@@ -1234,15 +1804,7 @@ def inject_tiddlers():
 
     \whitespace trim
     <h2 class="tc-title">
-    <$reveal type="match" state="$:/state/wiki-language" text="zh-hans">
-      <$view field="zh_title_hans" default=<<view field "title">> />
-    </$reveal>
-    <$reveal type="match" state="$:/state/wiki-language" text="zh-hant">
-      <$view field="zh_title_hant" default=<<view field "title">> />
-    </$reveal>
-    <$reveal type="match" state="$:/state/wiki-language" text="en">
-      <$view field="title" />
-    </$reveal>
+    <$view field={{{ [{$:/state/wiki-language}addprefix[$:/plugins/wiki/title-field/]get[text]else[title]] }}} default={{!!title}} />
     </h2>
     """).strip()
 
@@ -1297,19 +1859,9 @@ def inject_tiddlers():
     \whitespace trim
     <div class="tc-sidebar-lists tc-recent-list">
 
-      <!-- Language-aware date heading -->
+      <!-- Language-aware date heading; ISO date for any other language -->
       <div class="nj-recent-date">
-        <$reveal type="match" state="$:/state/wiki-language" text="en">
-          <$macrocall $name="now" format={{$:/language/RecentChanges/DateFormat}}/>
-        </$reveal>
-
-        <$reveal type="match" state="$:/state/wiki-language" text="zh-hans">
-          <$macrocall $name="now" format="YYYY年0MM月0DD日"/>
-        </$reveal>
-
-        <$reveal type="match" state="$:/state/wiki-language" text="zh-hant">
-          <$macrocall $name="now" format="YYYY年0MM月0DD日"/>
-        </$reveal>
+        <$macrocall $name="now" format={{{ [{$:/state/wiki-language}addprefix[$:/plugins/wiki/date-format/]get[text]] ~[{$:/state/wiki-language}match[en]then{$:/language/RecentChanges/DateFormat}] ~[[YYYY-0MM-0DD]] }}}/>
       </div>
 
       <!-- English Recent shows ONLY normal pages
@@ -1595,6 +2147,10 @@ def inject_tiddlers():
     """).strip()
 
     # write all helper tiddlers 
+    for key, variants in lang_variants.items():
+        for lang, text in variants.items():
+            variant = f"title: $:/plugins/wiki/{key}/{lang}\ntype: text/plain\n\n{text}"
+            (tiddlers_dir / f"__{key}.{lang}.tid").write_text(variant, encoding="utf-8")
     (tiddlers_dir / "__site-title.tid").write_text(site_title, encoding="utf-8")
     (tiddlers_dir / "__site-subtitle.tid").write_text(site_subtitle, encoding="utf-8")
     (tiddlers_dir / "__lang-state.tid").write_text(lang_state, encoding="utf-8")
@@ -1617,28 +2173,41 @@ def inject_tiddlers():
 
 
 # Creates the wiki by invoking TiddlyWiki CLI
-def build_wiki():
+def build_wiki(summaries: list[tuple[Path, dict]] | None = None):
     print("[publisher] Building wiki...", flush=True)
     # remove any previous wiki files so we don't keep
     # stale tiddlers or old tag definitions between runs. 
 
+    # The homepage's search scripts are kept: write_search_scripts()
+    # rewrites them only if they changed.
     site_output = SITE_DIR / "output"
     if site_output.exists():
-        shutil.rmtree(site_output)
+        for entry in site_output.iterdir():
+            if entry.name in SEARCH_SCRIPT_NAMES:
+                continue
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
         
-    ensure_tw_project()
-    inject_tiddlers()
+    # one tiddlers/ directory for every step below
+    tiddlers_dir = ensure_tw_project()
+    inject_tiddlers(tiddlers_dir)
+
+    # parse every summary once for the index, tiddlers and tags
+    if summaries is None:
+        summaries = load_all_summaries()
 
     # Build index of titles for autolinking
-    en_titles, zh_titles = build_title_index()
+    en_titles, zh_titles = build_title_index(summaries)
 
     # Create the tiddlers
-    created = create_tiddlers(en_titles, zh_titles)
+    created = create_tiddlers(en_titles, zh_titles, tiddlers_dir, summaries)
     if created == 0:
         print("[publisher] No summaries found; nothing to publish.", flush=True)
         return
 
-    create_tag_tiddlers()
+    create_tag_tiddlers(tiddlers_dir, summaries)
 
     outdir = WIKI_WORKDIR / "output"
     outdir.mkdir(parents=True, exist_ok=True)
@@ -1659,8 +2228,9 @@ def build_wiki():
 
 def main():
     print(f"[publisher] SUMMARY_DIR={SUMMARY_DIR} SITE_DIR={SITE_DIR}", flush=True)
-    build_wiki()
-    generate_summaries_output()
+    summaries = load_all_summaries()
+    build_wiki(summaries)
+    generate_summaries_output(summaries)
     create_homepage()
     inject_search_handler()
     print("[publisher] Done.", flush=True)
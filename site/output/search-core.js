@@ -0,0 +1,92 @@
+// Homepage search index, shared by index.html and search-worker.js.
+// Generated by the publisher; edit publisher/app.py instead.
+
+// Older summaries.json files have no pre-lowercased fields; fill them in
+// once here so the keystroke loop never lowercases.
+function normalizeSummaries(arr) {
+    if (!Array.isArray(arr)) return [];
+    for (const t of arr) {
+        if (t.title_lc === undefined) t.title_lc = (t.title || "").toLowerCase();
+        if (t.summary_lc === undefined) t.summary_lc = (t.summary || "").toLowerCase();
+    }
+    return arr;
+}
+
+function createSearchIndex(entries) {
+    // Query -> matches cache. Matches for a longer query are always a subset
+    // of the matches for its prefix, so typing "nanj" -> "nanji" only rescans
+    // the previous matches; the small LRU makes backspacing free as well.
+    const QUERY_CACHE_MAX = 32;
+    const queryCache = new Map();
+    let lastQuery = "";
+    let lastFiltered = [];
+
+    // Subindex: once the query is SUBINDEX_MIN_LEN chars long, its matches
+    // become the corpus for every later query that keeps that prefix, even
+    // when the characters after it are edited. Skipped for very broad
+    // prefixes so it stays small.
+    const SUBINDEX_MIN_LEN = 3;
+    const SUBINDEX_MAX = 500;
+    let subIndex = null;
+    let subIndexPrefix = "";
+
+    function cacheResult(q, arr){
+        queryCache.delete(q);
+        queryCache.set(q, arr);
+        if(queryCache.size > QUERY_CACHE_MAX){
+            queryCache.delete(queryCache.keys().next().value);
+        }
+    }
+
+    function matchesFor(q){
+        const hit = queryCache.get(q);
+        if(hit){
+            cacheResult(q, hit);
+            return hit;
+        }
+        if(subIndex && !q.startsWith(subIndexPrefix)){
+            console.debug("[search] prefix changed, back to full scan");
+            subIndex = null;
+            subIndexPrefix = "";
+        }
+        let source = entries;
+        if(lastQuery && q.startsWith(lastQuery)){
+            source = lastFiltered;
+        } else if(subIndex){
+            source = subIndex;
+        }
+
+        // Exact substring match (title OR summary), on the lowercased
+        // copies generate_summaries_output() writes. A plain loop avoids
+        // the per-call closure; it is not capped at the display limit
+        // because the full match list is what later keystrokes narrow.
+        const out = [];
+        for(let i = 0, n = source.length; i < n; i++){
+            const t = source[i];
+            if(t.title_lc.indexOf(q) !== -1 || t.summary_lc.indexOf(q) !== -1){
+                out.push(t);
+            }
+        }
+        cacheResult(q, out);
+
+        if(!subIndex && q.length >= SUBINDEX_MIN_LEN && out.length <= SUBINDEX_MAX){
+            subIndex = out;
+            subIndexPrefix = q;
+        }
+        return out;
+    }
+
+    return {
+        // q must already be trimmed and lowercased
+        query(q) {
+            if(!q){
+                lastQuery = "";
+                return [];
+            }
+            const out = matchesFor(q);
+            lastQuery = q;
+            lastFiltered = out;
+            return out;
+        }
+    };
+}
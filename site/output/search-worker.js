@@ -0,0 +1,39 @@
+// Homepage search worker: keeps the summaries index off the main thread.
+// Generated by the publisher; edit publisher/app.py instead.
+//
+//   {type: "init", url}      load summaries.json (relative to this file)
+//   {type: "query", q, seq}  -> {type: "results", seq, total, items}
+importScripts("search-core.js");
+
+const MAX_RESULTS = 200;
+let ready = null;
+
+async function load(url) {
+    try {
+        const res = await fetch(url);
+        const arr = res.ok ? await res.json() : [];
+        return createSearchIndex(normalizeSummaries(arr));
+    } catch (err) {
+        console.warn("Failed to load summaries:", err);
+        return createSearchIndex([]);
+    }
+}
+
+self.onmessage = async e => {
+    const msg = e.data || {};
+    if(msg.type === "init"){
+        ready = ready || load(msg.url || "summaries.json");
+        return;
+    }
+    if(msg.type === "query"){
+        ready = ready || load("summaries.json");
+        const index = await ready;
+        const matches = index.query(msg.q || "");
+        self.postMessage({
+            type: "results",
+            seq: msg.seq,
+            total: matches.length,
+            items: matches.slice(0, MAX_RESULTS).map(t => ({title: t.title})),
+        });
+    }
+};
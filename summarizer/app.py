@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
-import os, json, time, signal, sys, re
+import os, time, signal, sys, re, threading, sqlite3
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 from datetime import datetime, timezone  # for last_summarized_at timestamps
-from openai import OpenAI
+import random
+from openai import OpenAI, APIConnectionError, RateLimitError, InternalServerError
+import httpx
+import json
 import hashlib
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from contextlib import contextmanager
+
+# orjson parses and serialises several times faster than json; the
+# stdlib module stays as the fallback when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: push-based discovery of new clean files
+    from watchfiles import watch as watch_files, Change
+except ImportError:
+    watch_files = None
 
 DATA_DIR = Path(os.getenv("DATA_DIR", "/data"))
 CLEAN_DIR = DATA_DIR / "clean"
@@ -15,15 +34,135 @@ LLM_BASE_URL = os.getenv("LLM_BASE_URL", "http://brain:8000/v1")
 LLM_API_KEY  = os.getenv("LLM_API_KEY", "local")
 MODEL_NAME   = os.getenv("LLM_MODEL", "llama-3.1-8b-instruct")
 INTERVAL     = int(os.getenv("IDLE_INTERVAL", "60"))
-
-client = OpenAI(base_url=LLM_BASE_URL, api_key=LLM_API_KEY)
+# with watchfiles available, react to CLEAN_DIR changes instead of polling
+# every INTERVAL, and still do a full sweep this often as a safety net
+WATCH_CLEAN_DIR      = os.getenv("SUMMARIZER_WATCH", "1")
+FULL_SWEEP_INTERVAL  = int(os.getenv("FULL_SWEEP_INTERVAL", "3600"))
+LLM_TIMEOUT  = float(os.getenv("LLM_TIMEOUT", "120"))
+LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+# list the server's models at startup; off by default so (re)starts don't
+# wait on an extra round trip, and an unreachable LLM shows up on first use
+VERIFY_LLM   = os.getenv("VERIFY_LLM", "0")
+# receive completions as a token stream; a stalled generation then fails on
+# the read timeout between tokens rather than only after LLM_TIMEOUT overall
+LLM_STREAM   = os.getenv("LLM_STREAM", "0")
 
 SKIP_CATEGORY_DOCS      = os.getenv("SUMMARIZER_SKIP_CATEGORIES", "1")
 SUMMARIZER_SKIP_LISTS   = os.getenv("SUMMARIZER_SKIP_LISTS", "1")
 MIN_INPUT_CHARS         = int(os.getenv("MIN_INPUT_CHARS", "280"))
 MAX_LLM_CHARS           = int(os.getenv("MAX_LLM_CHARS", "3500"))
+# optional cap on the estimated input tokens per call (0 = chars only).
+# MAX_LLM_CHARS of Chinese is roughly 4x the tokens of the same chars of
+# English, so this evens out prefill cost across languages.
+MAX_INPUT_TOKENS        = int(os.getenv("MAX_INPUT_TOKENS", "0"))
+# cap on generated tokens per summary (0 = server default). Summaries are
+# asked for in <150 words / <180 characters, well inside this; the cap only
+# stops a runaway generation from holding a server slot.
+LLM_MAX_TOKENS          = int(os.getenv("LLM_MAX_TOKENS", "400"))
+# number of topics summarized in parallel (each topic is one worker thread)
+SUMMARIZER_CONCURRENCY  = int(os.getenv("SUMMARIZER_CONCURRENCY", "8"))
+# threads reading new/changed clean files during a scan (1 = read serially)
+CLEAN_SCAN_WORKERS      = int(os.getenv("CLEAN_SCAN_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))))
+# articles whose relevance is asked about in a single LLM call
+RELEVANCE_BATCH_SIZE    = int(os.getenv("RELEVANCE_BATCH_SIZE", "16"))
+# input characters per batched relevance call (never more than
+# MAX_LLM_CHARS); a batch whose snippets don't fit is split into more calls
+RELEVANCE_BATCH_CHARS   = min(
+    int(os.getenv("RELEVANCE_BATCH_CHARS", str(MAX_LLM_CHARS))), MAX_LLM_CHARS
+)
+# on-disk cache of LLM replies keyed by (prompt, input, model); "0" disables it
+LLM_CACHE               = os.getenv("LLM_CACHE", "1")
+LLM_CACHE_DIR           = Path(os.getenv("LLM_CACHE_DIR", str(DATA_DIR / "llm_cache")))
+# most recent cache entries also kept in memory (0 disables this layer)
+LLM_MEMORY_CACHE_SIZE   = int(os.getenv("LLM_MEMORY_CACHE_SIZE", "1024"))
+# translate an English summary into Simplified AND Traditional Chinese in one
+# JSON-mode call (one request, one prefill of the summary); "0" uses one
+# translation call per script
+LLM_FUSED_ZH            = os.getenv("LLM_FUSED_ZH", "1")
+# English summaries requested per LLM call; 1 (default) keeps one call per
+# article. Larger batches need a server context of roughly
+# SUMMARIZER_BATCH * MAX_LLM_CHARS characters plus the replies.
+SUMMARIZER_BATCH        = int(os.getenv("SUMMARIZER_BATCH", "1"))
+# keep the clean-file scan results and per-file skip decisions in a small
+# SQLite file, so a restarted summarizer doesn't re-read every unchanged
+# clean file once; "0" disables it
+SUMMARIZER_INDEX        = os.getenv("SUMMARIZER_INDEX", "1")
+SUMMARIZER_INDEX_PATH   = Path(
+    os.getenv("SUMMARIZER_INDEX_PATH", str(DATA_DIR / "summarizer_index.sqlite"))
+)
+
+def json_loads(raw):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON (non-ASCII kept as-is), as summary files are written."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# Topics are summarized on several threads; serialize log lines so they
+# never interleave mid-line. Re-entrant because the signal handler logs
+# on the main thread, possibly while that thread already holds it.
+_log_lock = threading.RLock()
+
+
+def log(*args) -> None:
+    with _log_lock:
+        print(*args, flush=True)
+
+
+# HTTP/2 to the LLM server multiplexes concurrent calls over one connection.
+# Opt-in: it needs the h2 package, and a plain-http base URL must speak h2c
+# (HTTP/2 with prior knowledge), which not every server does.
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "0")
+
+
+def _http2_kwargs() -> dict:
+    if LLM_HTTP2 != "1":
+        return {}
+    try:
+        import h2  # noqa: F401  (httpx imports it lazily)
+    except ImportError:
+        log("[WARN] LLM_HTTP2=1 but the h2 package is missing; using HTTP/1.1")
+        return {}
+    if LLM_BASE_URL.startswith("http://"):
+        # no TLS/ALPN to negotiate with, so talk HTTP/2 from the start
+        return {"http1": False, "http2": True}
+    return {"http2": True}
+
+
+# One keep-alive connection pool shared by every worker thread, so LLM calls
+# reuse sockets instead of reconnecting. Each topic worker can have up to two
+# calls in flight (see run_parallel), hence 2x the topic concurrency.
+_LLM_POOL_SIZE = max(4, 2 * SUMMARIZER_CONCURRENCY)
+http_client = httpx.Client(
+    **_http2_kwargs(),
+    limits=httpx.Limits(
+        max_connections=_LLM_POOL_SIZE,
+        max_keepalive_connections=_LLM_POOL_SIZE,
+        keepalive_expiry=60.0,
+    ),
+    timeout=httpx.Timeout(LLM_TIMEOUT, connect=10.0),
+)
+# retries are done in chat_once (with jitter), not by the SDK
+client = OpenAI(
+    base_url=LLM_BASE_URL,
+    api_key=LLM_API_KEY,
+    http_client=http_client,
+    max_retries=0,
+)
 
 # topic_id helper for dedupe across EN/zh variants (ASCII-only) 
+# topic_id normalization, as in the extractor's normalize_topic_id()
+_whitespace_re = re.compile(r"\s+")
+_non_slug_re = re.compile(r"[^a-z0-9_]+")
+
+
 def derive_topic_id(data: dict, json_path: Path) -> str:
     """
     Derive a stable, ASCII-only topic_id for this clean JSON.
@@ -62,8 +201,8 @@ def derive_topic_id(data: dict, json_path: Path) -> str:
         s = urllib.parse.unquote(raw)
         s_ascii = s.encode("ascii", "ignore").decode("ascii")
         s_ascii = s_ascii.lower().strip()
-        s_ascii = re.sub(r"\s+", "_", s_ascii)
-        s_ascii = re.sub(r"[^a-z0-9_]+", "", s_ascii)
+        s_ascii = _whitespace_re.sub("_", s_ascii)
+        s_ascii = _non_slug_re.sub("", s_ascii)
         if s_ascii:
             return s_ascii
 
@@ -73,6 +212,58 @@ def derive_topic_id(data: dict, json_path: Path) -> str:
 
 
 
+def iter_clean_json_paths(root: Optional[Path] = None):
+    """
+    Yield every *.json file under CLEAN_DIR (or root) as it is found.
+    Walks with os.scandir in directory order, without listing or sorting a
+    directory first; callers that need an order sort the result themselves.
+    """
+    root = CLEAN_DIR if root is None else root
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_clean_json_paths(Path(entry.path))
+            elif entry.name.endswith(".json") and entry.is_file():
+                yield Path(entry.path)
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# clean JSON path -> ((st_mtime_ns, st_size), topic_id, score) from the last
+# scan, so unchanged files are not re-read and re-parsed on every poll
+_clean_records: Dict[Path, Tuple[Tuple[int, int], str, Tuple[int, str, str]]] = {}
+
+
+def _scan_clean_file(json_path: Path) -> Optional[Tuple[str, Tuple[int, str, str]]]:
+    """Read one clean JSON and return (topic_id, score), or None if unreadable."""
+    try:
+        data = json_loads(json_path.read_bytes())
+    except Exception:
+        return None
+
+    topic_id = derive_topic_id(data, json_path)
+
+    # has_zh: 1 if this clean record has any zh signals, else 0
+    has_zh = 1 if (
+        (data.get("zh_url") or "").strip()
+        or (data.get("content_zh_hans") or "").strip()
+        or (data.get("content_zh_hant") or "").strip()
+    ) else 0
+
+    retrieved_at = (data.get("retrieved_at") or "")
+    return topic_id, (has_zh, retrieved_at, json_path.name)
+
+
 # collect one best clean doc per topic_id
 def collect_best_clean_paths() -> Dict[str, Path]:
     """
@@ -84,33 +275,64 @@ def collect_best_clean_paths() -> Dict[str, Path]:
     into separate files.
     """
     best: Dict[str, Tuple[Tuple[int, str, str], Path]] = {}
+    records: Dict[Path, Tuple[Tuple[int, int], str, Tuple[int, str, str]]] = {}
+
+    scanned = []  # (path, stat signature, (topic_id, score) or None to read)
+    for json_path in iter_clean_json_paths():
+        stat_sig = _stat_signature(json_path)
+        cached = _clean_records.get(json_path)
+        if cached and stat_sig is not None and cached[0] == stat_sig:
+            scanned.append((json_path, stat_sig, cached[1:]))
+        else:
+            scanned.append((json_path, stat_sig, None))
+
+    # new or changed files are read and parsed on a few threads (file reads
+    # release the GIL); a warm scan usually has none to read at all
+    to_read = [path for path, _, found in scanned if found is None]
+    if len(to_read) > 1 and CLEAN_SCAN_WORKERS > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(CLEAN_SCAN_WORKERS, len(to_read)),
+            thread_name_prefix="summarizer-scan",
+        ) as scan_pool:
+            read = dict(zip(to_read, scan_pool.map(_scan_clean_file, to_read)))
+    else:
+        read = {path: _scan_clean_file(path) for path in to_read}
 
-    for json_path in sorted(CLEAN_DIR.rglob("*.json")):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-
-        topic_id = derive_topic_id(data, json_path)
-
-        # has_zh: 1 if this clean record has any zh signals, else 0
-        has_zh = 1 if (
-            (data.get("zh_url") or "").strip()
-            or (data.get("content_zh_hans") or "").strip()
-            or (data.get("content_zh_hant") or "").strip()
-        ) else 0
-
-        retrieved_at = (data.get("retrieved_at") or "")
-        score = (has_zh, retrieved_at, json_path.name)
+    for json_path, stat_sig, found in scanned:
+        if found is None:
+            found = read[json_path]
+            if found is None:
+                continue
+        topic_id, score = found
+        if stat_sig is not None:
+            records[json_path] = (stat_sig, topic_id, score)
 
+        # full-path tiebreak keeps the choice independent of walk order
         prev = best.get(topic_id)
-        if (prev is None) or (score > prev[0]):
+        if (
+            prev is None
+            or score > prev[0]
+            or (score == prev[0] and json_path < prev[1])
+        ):
             best[topic_id] = (score, json_path)
 
+    # forget files that disappeared since the last scan
+    _clean_records.clear()
+    _clean_records.update(records)
+
     # unwrap to topic_id -> Path
     return {topic_id: path for topic_id, (score, path) in best.items()}
 
 
+# wiki-link patterns, compiled once (these run on every article and summary)
+_wikilink_re = re.compile(r"\[\[([^\]]+)\]\]")
+# One pass over both link forms: groups 1/2 are [[title|label]], group 3 is
+# a plain [[title]] (including odd leftovers such as [[|label]]).
+_wikilink_any_re = re.compile(r"\[\[(?:([^|\]]+)\|([^\]]*)|([^\]]+))\]\]")
+_bracket_trans = str.maketrans({"[": "", "]": ""})
+_ZH_LANGS = frozenset({"zh", "zh_hans", "zh-hans", "zh_hant", "zh-hant"})
+
+
 # helper to remove raw wiki-style links like [[Target]] or [[Target|Label]]
 # from the source text before we send it to the LLM.
 def strip_wikilinks_markup(text: Optional[str]) -> Optional[str]:
@@ -123,7 +345,11 @@ def strip_wikilinks_markup(text: Optional[str]) -> Optional[str]:
             return inner.split("|")[-1]
         return inner
 
-    return re.sub(r"\[\[([^\]]+)\]\]", _repl, text)
+    return _wikilink_re.sub(_repl, text)
+
+
+# a whole '注：...' / '注意：...' line, with its line break
+_note_line_re = re.compile(r"^[^\S\n]*(?:注：|注意：).*(?:\n|$)", re.MULTILINE)
 
 
 def strip_chinese_notes(text: Optional[str]) -> Optional[str]:
@@ -134,15 +360,11 @@ def strip_chinese_notes(text: Optional[str]) -> Optional[str]:
     if not text:
         return text
 
-    keep_lines = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("注：") or stripped.startswith("注意："):
-            continue
-        keep_lines.append(line)
+    # Most summaries have no note lines at all: skip the regex pass.
+    if "注：" not in text and "注意：" not in text:
+        return text.strip() or None
 
-    cleaned = "\n".join(keep_lines).strip()
-    return cleaned or None
+    return _note_line_re.sub("", text).strip() or None
 
 
 # aggressively clean [[...]] markup from LLM output
@@ -152,7 +374,7 @@ def cleanup_inline_links(text: Optional[str], lang: str) -> Optional[str]:
 
     - Handle [[title|label]] and [[title]].
     - For Chinese summaries, prefer the Chinese part (left side)
-      and then aggressively remove any leftover [[ or ]].
+      and then aggressively remove any leftover [ or ].
 
     This is intentionally "brute force" so no raw [[...]] shows up
     in rendered tiddlers.
@@ -160,28 +382,74 @@ def cleanup_inline_links(text: Optional[str], lang: str) -> Optional[str]:
     if not text:
         return text
 
-    # 1) [[title|label]]
-    def _repl_pipe(m: re.Match) -> str:
+    is_zh = lang in _ZH_LANGS
+
+    def _repl(m: re.Match) -> str:
+        plain = m.group(3)
+        if plain is not None:
+            return plain
         left, right = m.group(1), m.group(2)
         # For Chinese, keep left (usually Chinese title)
-        if lang in ("zh", "zh_hans", "zh-hans", "zh_hant", "zh-hant"):
+        if is_zh:
             return left
         # For English, keep right if present
         return right or left
 
-    text = re.sub(r"\[\[([^|\]]+)\|([^\]]*)\]\]", _repl_pipe, text)
+    text = _wikilink_any_re.sub(_repl, text)
 
-    # 2) [[title]]
-    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
-
-    # 3) For Chinese, nuke any stray [[ or ]] that somehow survived
-    if lang in ("zh", "zh_hans", "zh-hans", "zh_hant", "zh-hant"):
-        text = text.replace("[[", "").replace("]]", "")
+    # For Chinese, nuke any stray brackets that somehow survived
+    if is_zh and ("[" in text or "]" in text):
+        text = text.translate(_bracket_trans)
 
     return text
 
 
 
+# Wikipedia category -> tag for the summary (read-only, shared by workers)
+CATEGORY_TAG_MAP = MappingProxyType({
+    "Tourist attractions in Nanjing": "景点",
+    "History of Nanjing": "历史",
+    "Cuisine of Nanjing": "美食",
+    "Parks in Nanjing": "公园",
+    "Museums in Nanjing": "博物馆",
+    "Universities and colleges in Nanjing": "高校",
+    "Sports in Nanjing": "体育",
+    "Transportation in Nanjing": "交通",
+    "Economy of Nanjing": "经济",
+    "Culture in Nanjing": "文化",
+    "Geography of Nanjing": "地理",
+    "Historic sites in Nanjing": "历史遗迹",
+    "Mass media in Nanjing": "媒体",
+    "Religion in Nanjing": "宗教",
+    "Government of Nanjing": "政府",
+    "Nanjing": "南京",
+    "Buildings and structures in Nanjing": "建筑",
+    "Events in Nanjing": "事件",
+    "Arts in Nanjing": "艺术",
+    "Science and technology in Nanjing": "科技",
+    "Notable people from Nanjing": "名人",
+    "Companies based in Nanjing": "公司",
+    "Hospitals in Nanjing": "医院",
+    "Bridges in Nanjing": "桥梁",
+    "Streets in Nanjing": "街道",
+    "Rivers of Nanjing": "河流",
+    "Lakes of Nanjing": "湖泊",
+    "Mountains of Nanjing": "山脉",
+    "Festivals in Nanjing": "节日",
+    "Tourism in Nanjing": "旅游",
+})
+_CATEGORY_TAG_KEYS = frozenset(CATEGORY_TAG_MAP)
+
+# Names that mark a title / URL / category as Nanjing-related
+_NANJING_KEYS = ("nanjing", "nánjīng", "jinling", "南京", "金陵")
+
+
+# how much of an article the relevance check sees (the lead section); in a
+# batched call a snippet may be cut down to RELEVANCE_MIN_SNIPPET_CHARS
+RELEVANCE_SNIPPET_CHARS = 1500
+RELEVANCE_MIN_SNIPPET_CHARS = 1000
+
+
 # small relevance classifier for Nanjing-related content
 def classify_relevance_with_llm(sample_text: str) -> bool:
     """
@@ -198,7 +466,7 @@ def classify_relevance_with_llm(sample_text: str) -> bool:
         "institutions, or events).\n"
         "Reply with exactly one word: RELEVANT or IRRELEVANT."
     )
-    resp = chat_once(sys_prompt, sample_text[:1500])
+    resp = chat_once(sys_prompt, sample_text[:RELEVANCE_SNIPPET_CHARS])
     if not resp:
         return True
     answer = resp.strip().upper()
@@ -209,7 +477,65 @@ def classify_relevance_with_llm(sample_text: str) -> bool:
     return True  # default to keeping rather than throwing away
 
 
-def is_relevant_article(
+_relevance_line_re = re.compile(r"^\W*(\d+)\W+(IRRELEVANT|RELEVANT)\b", re.IGNORECASE)
+
+
+def classify_relevance_batch(samples: list[str]) -> list[bool]:
+    """
+    Ask the LLM about several article snippets per call.
+    Returns one verdict per sample, in order. Each call holds as many
+    snippets of at least RELEVANCE_MIN_SNIPPET_CHARS as fit in
+    RELEVANCE_BATCH_CHARS; the rest go to further calls. Snippets whose line
+    is missing from the reply, or whose call failed, fall back to
+    classify_relevance_with_llm().
+    """
+    results = [True] * len(samples)  # empty input is kept, as in the single check
+    todo = [i for i, s in enumerate(samples) if s]
+    per_call = max(1, RELEVANCE_BATCH_CHARS // (RELEVANCE_MIN_SNIPPET_CHARS + 8))
+    for start in range(0, len(todo), per_call):
+        chunk = todo[start:start + per_call]
+        if len(chunk) == 1:
+            results[chunk[0]] = classify_relevance_with_llm(samples[chunk[0]])
+        else:
+            _classify_relevance_chunk(samples, chunk, results)
+    return results
+
+
+def _classify_relevance_chunk(samples: list[str], todo: list[int], results: list[bool]) -> None:
+    """One batched relevance call for samples[i] for i in todo; fills results."""
+    sys_prompt = (
+        "You are a filter deciding if an article is about Nanjing, China or "
+        "closely related topics (its history, culture, landmarks, people, "
+        "institutions, or events).\n"
+        "For each numbered article snippet, reply on its own line: "
+        "'<N>: RELEVANT' or '<N>: IRRELEVANT'."
+    )
+    # share the call's budget, but keep at least the lead of each article
+    per_item = max(
+        RELEVANCE_MIN_SNIPPET_CHARS,
+        min(RELEVANCE_SNIPPET_CHARS, RELEVANCE_BATCH_CHARS // len(todo) - 8),
+    )
+    user_text = "\n\n".join(
+        f"[{n}] {samples[i][:per_item]}" for n, i in enumerate(todo, 1)
+    )
+    resp = chat_once(sys_prompt, user_text) or ""
+    if not resp:
+        log(f"[WARN] batched relevance check failed; checking {len(todo)} articles one by one")
+
+    verdicts: Dict[int, bool] = {}
+    for line in resp.splitlines():
+        m = _relevance_line_re.match(line.strip())
+        if m:
+            verdicts[int(m.group(1))] = m.group(2).upper() == "RELEVANT"
+
+    for n, i in enumerate(todo, 1):
+        if n in verdicts:
+            results[i] = verdicts[n]
+        else:
+            results[i] = classify_relevance_with_llm(samples[i])
+
+
+def looks_nanjing_related(
     url: str,
     title: str,
     categories: list[str],
@@ -218,16 +544,34 @@ def is_relevant_article(
     zh_hant_text: str,
 ) -> bool:
     """
-    Combined heuristic + LLM relevance gate for Nanjing topics.
+    Cheap heuristic half of the relevance gate (no LLM call).
     """
     low_title = (title or "").lower()
-    low_url = (url or "").lower()
+    low_url = urllib.parse.unquote(url or "").lower()
     cat_text = " ".join(categories or []).lower()
 
-    # Quick heuristics: if we clearly see Nanjing / 南京, keep it.
-    if "nanjing" in low_title or "nanjing" in low_url or "nanjing" in cat_text:
+    # Quick heuristics: if we clearly see Nanjing / 南京 / Jinling / 金陵
+    # in the title, URL or categories, keep it.
+    for key in _NANJING_KEYS:
+        if key in low_title or key in low_url or key in cat_text:
+            return True
+    if "南京" in (en_source or "") or "南京" in (zh_hans_text or "") or "南京" in (zh_hant_text or ""):
         return True
-    if "南京" in title or "南京" in (en_source or "") or "南京" in (zh_hans_text or "") or "南京" in (zh_hant_text or ""):
+    return False
+
+
+def is_relevant_article(
+    url: str,
+    title: str,
+    categories: list[str],
+    en_source: str,
+    zh_hans_text: str,
+    zh_hant_text: str,
+) -> bool:
+    """
+    Combined heuristic + LLM relevance gate for Nanjing topics.
+    """
+    if looks_nanjing_related(url, title, categories, en_source, zh_hans_text, zh_hant_text):
         return True
 
     # If nothing obviously Nanjing-related, call the LLM on a short sample
@@ -236,7 +580,9 @@ def is_relevant_article(
 
 
 def _graceful_exit(signum, frame):
-    print("Summarizer shutting down...", flush=True)
+    log("Summarizer shutting down...")
+    # close pooled keep-alive connections to the LLM server cleanly
+    http_client.close()
     sys.exit(0)
 
 
@@ -244,391 +590,1166 @@ signal.signal(signal.SIGINT, _graceful_exit)
 signal.signal(signal.SIGTERM, _graceful_exit)
 
 
-def chat_once(system_prompt: str, user_text: str) -> Optional[str]:
-    # Hard-cap the amount of text we send to the LLM to avoid context errors
-    text = (user_text or "")
-    if len(text) > MAX_LLM_CHARS:
-        print(
-            f"[summarizer] truncating input from {len(text)} to {MAX_LLM_CHARS} chars",
-            flush=True,
-        )
-        text = text[:MAX_LLM_CHARS]
-
+def _llm_cache_path(
+    system_prompt: str, text: str, json_mode: bool = False, max_tokens: int = 0
+) -> Path:
+    # the reply also depends on the output format and length cap
+    h = hashlib.sha256(
+        "\x00".join(
+            (MODEL_NAME, system_prompt, text, f"json={int(json_mode)}", f"max_tokens={max_tokens}")
+        ).encode("utf-8")
+    ).hexdigest()
+    return LLM_CACHE_DIR / h[:2] / f"{h}.txt"
+
+
+# cache path -> reply, in least-recently-used order. Duplicate articles
+# (redirects, zh variants) are usually processed in the same pass, so their
+# repeat calls are answered without touching the disk.
+_llm_memory_cache: "OrderedDict[Path, str]" = OrderedDict()
+_llm_memory_lock = threading.Lock()
+
+
+def _llm_memory_put(path: Path, reply: str) -> None:
+    if LLM_MEMORY_CACHE_SIZE <= 0:
+        return
+    with _llm_memory_lock:
+        _llm_memory_cache[path] = reply
+        _llm_memory_cache.move_to_end(path)
+        while len(_llm_memory_cache) > LLM_MEMORY_CACHE_SIZE:
+            _llm_memory_cache.popitem(last=False)
+
+
+def _llm_cache_get(path: Path) -> Optional[str]:
+    with _llm_memory_lock:
+        reply = _llm_memory_cache.get(path)
+        if reply is not None:
+            _llm_memory_cache.move_to_end(path)
+            return reply
     try:
-        resp = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": text},
-            ],
-            temperature=0.0,
-        )
-        return (resp.choices[0].message.content or "").strip()
-    except Exception as e:
-        print(f"[ERROR] LLM call failed: {e}", flush=True)
+        reply = path.read_text(encoding="utf-8")
+    except OSError:
         return None
+    _llm_memory_put(path, reply)
+    return reply
 
 
-def summarize_en(source_text: str) -> Optional[str]:
-    return chat_once(
-        "Write a concise, factual wiki-style summary (3–6 sentences, <150 words). "
-        "Plain text only. Include key facts present in the input; do not invent details.",
-        source_text,
-    )
+def _llm_cache_put(path: Path, reply: str) -> None:
+    _llm_memory_put(path, reply)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(reply, encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        log(f"[WARN] could not write LLM cache {path}: {e}")
+
+
+# Transient failures (server queueing, timeouts, dropped connections, 5xx)
+# worth retrying; anything else (bad request, auth) fails straight away.
+_RETRYABLE_LLM_ERRORS = (
+    APIConnectionError,  # APITimeoutError is a subclass
+    RateLimitError,
+    InternalServerError,
+    httpx.HTTPError,
+)
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Seconds asked for by a Retry-After header on the error's response, if any."""
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to our own backoff
+
+# LLM requests currently in flight across all worker threads, and the
+# highest count seen since the last reset; process_once() reports the peak
+# so SUMMARIZER_CONCURRENCY can be tuned against the LLM server.
+_in_flight_lock = threading.Lock()
+_in_flight = 0
+_in_flight_peak = 0
+
+
+@contextmanager
+def _track_in_flight():
+    global _in_flight, _in_flight_peak
+    with _in_flight_lock:
+        _in_flight += 1
+        _in_flight_peak = max(_in_flight_peak, _in_flight)
+    try:
+        yield
+    finally:
+        with _in_flight_lock:
+            _in_flight -= 1
 
 
-def summarize_zh(source_text: str, use_trad: bool, main_title: Optional[str]) -> Optional[str]:
-    script = "Traditional Chinese" if use_trad else "Simplified Chinese"
-    sys_prompt = (
+def _reset_in_flight_peak() -> int:
+    global _in_flight_peak
+    with _in_flight_lock:
+        peak, _in_flight_peak = _in_flight_peak, _in_flight
+    return peak
+
+
+_inline_ws_re = re.compile(r"[ \t]+")
+_SENTENCE_ENDS = (". ", "! ", "? ", "。", "！", "？")
+
+
+def _smart_truncate(text: str, limit: int) -> str:
+    """
+    Cut text to at most `limit` chars, ending on a paragraph break or,
+    failing that, a sentence end, so the LLM never sees half a sentence.
+    Falls back to a hard cut when no boundary is in the last 40%.
+    """
+    if len(text) <= limit:
+        return text
+    floor = int(limit * 0.6)
+    cut = text.rfind("\n\n", 0, limit)
+    if cut < floor:
+        for mark in _SENTENCE_ENDS:
+            i = text.rfind(mark, 0, limit)
+            if i >= 0:
+                cut = max(cut, i + len(mark.rstrip()))
+    if cut < floor:
+        cut = limit
+    return text[:cut].rstrip()
+
+
+_cjk_re = re.compile(r"[\u3400-\u9fff\uf900-\ufaff]")
+
+
+def _token_char_limit(text: str, max_tokens: int) -> int:
+    """
+    Number of leading chars of text that fit in roughly max_tokens.
+    No tokenizer for the served model is available here, so this estimates
+    one token per CJK character and one per four other characters.
+    """
+    cjk = len(_cjk_re.findall(text))
+    estimate = cjk + (len(text) - cjk) / 4
+    if estimate <= max_tokens:
+        return len(text)
+    return int(len(text) * max_tokens / estimate)
+
+
+def chat_once(
+    system_prompt: str,
+    user_text: str,
+    json_mode: bool = False,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> Optional[str]:
+    """
+    Send one chat completion and return the reply text (None on failure).
+    max_tokens caps the reply (default LLM_MAX_TOKENS); calls that return
+    several summaries at once pass a proportionally larger cap.
+    Callers pass one of the fixed _SYS_* prompts unchanged and put anything
+    per-article (titles, target script) in user_text. The system prompt is
+    then a byte-identical prefix on every call, which servers with prefix
+    caching (vLLM --enable-prefix-caching, llama.cpp) reuse instead of
+    re-encoding.
+    """
+    # Collapse runs of spaces/tabs so layout noise doesn't use up the budget
+    text = _inline_ws_re.sub(" ", user_text or "")
+
+    # Hard-cap the amount of text we send to the LLM to avoid context errors
+    # (batched calls pass a larger cap sized for all their documents)
+    limit = max_chars or MAX_LLM_CHARS
+    if MAX_INPUT_TOKENS > 0 and not max_chars:
+        limit = min(limit, _token_char_limit(text, MAX_INPUT_TOKENS))
+    if len(text) > limit:
+        text = _smart_truncate(text, limit)
+        log(f"[summarizer] truncating input from {len(user_text)} to {len(text)} chars")
+
+    # Every call is deterministic (temperature 0), so an identical prompt +
+    # input + model can reuse the earlier reply, e.g. when only one language
+    # of an article changed and the other summary is regenerated verbatim.
+    max_tokens = LLM_MAX_TOKENS if max_tokens is None else max_tokens
+    cache_path = None
+    if LLM_CACHE == "1":
+        cache_path = _llm_cache_path(system_prompt, text, json_mode, max_tokens)
+        cached = _llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+    extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+    if max_tokens > 0:
+        extra["max_tokens"] = max_tokens
+
+    attempts = max(1, LLM_MAX_ATTEMPTS)
+    for attempt in range(attempts):
+        try:
+            with _track_in_flight():
+                resp = client.chat.completions.create(
+                    model=MODEL_NAME,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": text},
+                    ],
+                    temperature=0.0,
+                    timeout=LLM_TIMEOUT,
+                    stream=LLM_STREAM == "1",
+                    **extra,
+                )
+                if LLM_STREAM == "1":
+                    # a dropped stream raises here and is retried like any
+                    # other connection error
+                    parts = []
+                    finish_reason = None
+                    for chunk in resp:
+                        if not chunk.choices:
+                            continue
+                        if chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                        finish_reason = chunk.choices[0].finish_reason or finish_reason
+                    reply = "".join(parts).strip()
+                else:
+                    reply = (resp.choices[0].message.content or "").strip()
+                    finish_reason = resp.choices[0].finish_reason
+            break
+        except _RETRYABLE_LLM_ERRORS as e:
+            if attempt + 1 >= attempts:
+                log(f"[ERROR] LLM call failed after {attempts} attempts: {e}")
+                return None
+            delay = min(2 ** attempt + random.random(), 10.0)
+            # a busy server (429/503) may say how long to back off
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, 60.0))
+            log(f"[WARN] LLM call failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+        except Exception as e:
+            log(f"[ERROR] LLM call failed: {e}")
+            return None
+
+    # a reply cut off at max_tokens is still returned, but not cached, so
+    # the next run asks again instead of reusing a truncated summary
+    cut_off = finish_reason == "length"
+    if cut_off:
+        log(f"[WARN] LLM reply cut off at max_tokens={max_tokens}")
+    if cache_path is not None and reply and not cut_off:
+        _llm_cache_put(cache_path, reply)
+    return reply
+
+
+# System prompts, built once and never varied per article (title hints go
+# in the user message), so the LLM server can prefix-cache them.
+_SYS_SUMMARIZE_EN = (
+    "Write a concise, factual wiki-style summary (3–6 sentences, <150 words). "
+    "Plain text only. Include key facts present in the input; do not invent details."
+)
+_SYS_SUMMARIZE_EN_BATCH = (
+    "For each numbered document, write a concise, factual wiki-style summary "
+    "(3–6 sentences, <150 words). Plain text only. Include key facts present "
+    "in that document; do not invent details or mix documents. "
+    'Respond with JSON only: {"summaries": ["<summary of [1]>", "<summary of [2]>", ...]} '
+    "with exactly one entry per document, in order."
+)
+# keyed by use_trad
+_SYS_SUMMARIZE_ZH = {
+    use_trad: (
         f"根據以下中文資料，用{script}撰寫百科式摘要，3–6句，<180字。"
         "只使用自然段落，不能使用項目符號、標題或任何Markdown標記。"
         "忠實於輸入內容，不要新增事實。"
     )
+    for use_trad, script in ((False, "Simplified Chinese"), (True, "Traditional Chinese"))
+}
+# The Simplified and Traditional translations of one summary share the same
+# system prompt and start the user message with the summary itself; only the
+# short target line at the end differs. A server with prefix caching (e.g.
+# vLLM --enable-prefix-caching) then reuses the prefill of the second call.
+_SYS_TRANSLATE_ZH = (
+    "Translate the English wiki summary into the Chinese script named on the "
+    "last line. Keep the facts unchanged and add nothing; write natural "
+    "paragraphs without any markup."
+)
+_SYS_TRANSLATE_ZH_PAIR = (
+    "Translate the English wiki summary into Simplified Chinese and into "
+    "Traditional Chinese. 保持事實一致，不要新增內容；輸出自然段落，不能使用任何標記。"
+    ' Respond with JSON only: {"hans": "<Simplified Chinese>", "hant": "<Traditional Chinese>"}.'
+)
+_SYS_TRANSLATE_EN = (
+    "Translate the following Chinese encyclopedic summary into natural English. "
+    "Keep it concise and factual (3–6 sentences). Plain text only."
+)
+_SYS_HANS_TO_HANT = (
+    "Convert the following Simplified Chinese text into Traditional Chinese. "
+    "Do not change meaning or add/remove information."
+)
+
+
+def summarize_en(source_text: str) -> Optional[str]:
+    return chat_once(_SYS_SUMMARIZE_EN, source_text)
+
+
+def summarize_en_batch(sources: list[str]) -> list[Optional[str]]:
+    """
+    Summarize several English articles in one JSON-mode call.
+    Returns one summary per source, in order; an entry is None when the
+    reply doesn't cover it, and the caller summarizes that one on its own.
+    """
+    if len(sources) <= 1:
+        return [summarize_en(src) for src in sources]
+
+    # each document keeps the budget it would have had on its own
+    docs = []
+    for src in sources:
+        doc = _inline_ws_re.sub(" ", src)
+        limit = MAX_LLM_CHARS
+        if MAX_INPUT_TOKENS > 0:
+            limit = min(limit, _token_char_limit(doc, MAX_INPUT_TOKENS))
+        docs.append(_smart_truncate(doc, limit))
+    user_text = "\n\n".join(f"[{n}] {doc}" for n, doc in enumerate(docs, 1))
+    reply = chat_once(
+        _SYS_SUMMARIZE_EN_BATCH,
+        user_text,
+        json_mode=True,
+        max_chars=len(user_text),
+        max_tokens=LLM_MAX_TOKENS * len(sources),
+    )
+
+    results: list[Optional[str]] = [None] * len(sources)
+    try:
+        summaries = json_loads(reply or "").get("summaries")
+    except (json.JSONDecodeError, AttributeError):
+        summaries = None
+    if not isinstance(summaries, list) or len(summaries) != len(sources):
+        log(f"[WARN] batched EN summary reply unusable; summarizing {len(sources)} articles one by one")
+        return results
+    for i, summary in enumerate(summaries):
+        if isinstance(summary, str) and summary.strip():
+            results[i] = summary.strip()
+    return results
+
+
+def summarize_zh(source_text: str, use_trad: bool, main_title: Optional[str]) -> Optional[str]:
+    # the title goes ahead of the article (not into the system prompt) so
+    # it survives truncation and the system prompt stays the same per call
     if main_title:
-        sys_prompt += f" 本條目的中文標題為「{main_title}」，提及主體時請使用此名稱。"
-    return chat_once(sys_prompt, source_text)
+        source_text = f"本條目的中文標題為「{main_title}」，提及主體時請使用此名稱。\n\n{source_text}"
+    return chat_once(_SYS_SUMMARIZE_ZH[use_trad], source_text)
 
 
 def translate_zh_from_en(en_summary: str, use_trad: bool, main_title: Optional[str]) -> Optional[str]:
     if use_trad:
-        sys_prompt = (
-            "Translate the English wiki summary into Traditional Chinese. "
-            "保持事實一致，不要新增內容；輸出自然段落，不能使用任何標記。"
-        )
+        target = "Target: Traditional Chinese（繁體中文）。"
         if main_title:
-            sys_prompt += f" 主體的中文名稱是「{main_title}」，請在譯文中使用。"
+            target += f" 主體的中文名稱是「{main_title}」，請在譯文中使用。"
     else:
-        sys_prompt = (
-            "Translate the English wiki summary into Simplified Chinese. "
-            "保持事实一致，不要新增内容；输出自然段落，不能使用任何标记。"
-        )
+        target = "Target: Simplified Chinese（简体中文）。"
         if main_title:
-            sys_prompt += f" 主体的中文名称是“{main_title}”，请在译文中使用。"
-    return chat_once(sys_prompt, en_summary)
+            target += f" 主体的中文名称是“{main_title}”，请在译文中使用。"
+    return chat_once(_SYS_TRANSLATE_ZH, f"{en_summary}\n\n{target}")
 
 
-def translate_en_from_zh(ch_summary: str) -> Optional[str]:
-    return chat_once(
-        "Translate the following Chinese encyclopedic summary into natural English. "
-        "Keep it concise and factual (3–6 sentences). Plain text only.",
-        ch_summary,
+def translate_zh_pair_from_en(
+    en_summary: str, main_title: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Translate the English summary into Simplified and Traditional Chinese with
+    a single JSON-mode call. Returns (hans, hant); either is None if the reply
+    is unusable, so the caller can fall back to translate_zh_from_en().
+    """
+    user_text = en_summary
+    if main_title:
+        user_text = f"主体的中文名称是“{main_title}”，请在两种译文中使用（繁体译文用繁体写法）。\n\n{user_text}"
+    reply = chat_once(
+        _SYS_TRANSLATE_ZH_PAIR, user_text, json_mode=True, max_tokens=2 * LLM_MAX_TOKENS
     )
+    if not reply:
+        return None, None
+    try:
+        obj = json_loads(reply)
+    except json.JSONDecodeError:
+        log("[WARN] fused zh translation was not valid JSON; translating separately")
+        return None, None
+    if not isinstance(obj, dict):
+        return None, None
+
+    def _field(key: str) -> Optional[str]:
+        value = obj.get(key)
+        return (value.strip() or None) if isinstance(value, str) else None
+
+    return _field("hans"), _field("hant")
+
+
+def translate_en_from_zh(ch_summary: str) -> Optional[str]:
+    return chat_once(_SYS_TRANSLATE_EN, ch_summary)
 
 
 def convert_hans_to_hant(hans_text: str) -> Optional[str]:
-    return chat_once(
-        "Convert the following Simplified Chinese text into Traditional Chinese. "
-        "Do not change meaning or add/remove information.",
-        hans_text,
-    )
+    return chat_once(_SYS_HANS_TO_HANT, hans_text)
 
 
-def process_once() -> int:
-    wrote = 0
+# Pool for independent LLM calls made *within* one topic. It is separate
+# from the per-topic pool in process_once() so a topic waiting on its own
+# calls can never starve them of a worker.
+_CALL_POOL = ThreadPoolExecutor(
+    max_workers=max(1, SUMMARIZER_CONCURRENCY), thread_name_prefix="summarizer-llm"
+)
 
-    # only process one best clean JSON per topic_id 
-    best_paths = collect_best_clean_paths()
 
-    for topic_id, json_path in sorted(best_paths.items()):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"[summarizer] skip unreadable clean JSON {json_path}: {e}", flush=True)
+def run_parallel(*calls):
+    """
+    Run independent zero-argument callables concurrently and return their
+    results in order. A None entry is skipped and yields None.
+    """
+    results = [None] * len(calls)
+    futures = {}
+    first = None
+    for i, call in enumerate(calls):
+        if call is None:
             continue
+        if first is None:
+            first = i  # run this one on the current thread
+        else:
+            futures[i] = _CALL_POOL.submit(call)
 
-        # ensure topic_id is present in the in-memory dict as well
-        topic_id = derive_topic_id(data, json_path)
-        data["topic_id"] = topic_id
+    if first is not None:
+        results[first] = calls[first]()
+    for i, fut in futures.items():
+        results[i] = fut.result()
+    return results
 
-        # summaries named by topic_id, not raw filename 
-        out_path = SUMMARY_DIR / f"{topic_id}.json"
 
-        try:
-            url = data.get("url") or ""
-            doc_type = (data.get("doc_type") or "").lower()
-            lang = (data.get("lang") or "").lower()
-
-            categories = data.get("categories") or []
-            derived_tags = set()
-
-            CATEGORY_TAG_MAP = {
-                "Tourist attractions in Nanjing": "景点",
-                "History of Nanjing": "历史",
-                "Cuisine of Nanjing": "美食",
-                "Parks in Nanjing": "公园",
-                "Museums in Nanjing": "博物馆",
-                "Universities and colleges in Nanjing": "高校",
-                "Sports in Nanjing": "体育",
-                "Transportation in Nanjing": "交通",
-                "Economy of Nanjing": "经济",
-                "Culture in Nanjing": "文化",
-                "Geography of Nanjing": "地理",
-                "Historic sites in Nanjing": "历史遗迹",
-                "Mass media in Nanjing": "媒体",
-                "Religion in Nanjing": "宗教",
-                "Government of Nanjing": "政府",
-                "Nanjing": "南京",
-                "Buildings and structures in Nanjing": "建筑",
-                "Events in Nanjing": "事件",
-                "Arts in Nanjing": "艺术",
-                "Science and technology in Nanjing": "科技",
-                "Notable people from Nanjing": "名人",
-                "Companies based in Nanjing": "公司",
-                "Hospitals in Nanjing": "医院",
-                "Bridges in Nanjing": "桥梁",
-                "Streets in Nanjing": "街道",
-                "Rivers of Nanjing": "河流",
-                "Lakes of Nanjing": "湖泊",
-                "Mountains of Nanjing": "山脉",
-                "Festivals in Nanjing": "节日",
-                "Tourism in Nanjing": "旅游",
-            }
-
-            for cat in categories:
-                tag = CATEGORY_TAG_MAP.get(cat)
-                if tag:
-                    derived_tags.add(tag)
-
-            # Always keep a generic 'summary' tag too
-            derived_tags.add("summary")
-            data["tags"] = sorted(derived_tags)
-
-            # incremental summarization by content_hash + topic_id 
-            clean_hash = (data.get("content_hash") or "").strip()
-            existing = None
-            if out_path.exists():
-                try:
-                    existing = json.loads(out_path.read_text(encoding="utf-8"))
-                except Exception:
-                    existing = None
-
-            if existing:
-                old_hash = (existing.get("content_hash") or "").strip()
-                if clean_hash and old_hash and clean_hash == old_hash:
-                    # content unchanged → keep old summaries, skip work
-                    print(
-                        f"[summarizer] unchanged content_hash for topic_id={topic_id}, "
-                        f"skipping re-summarize",
-                        flush=True,
-                    )
-                    continue
-
-            if (
-                not url
-                or doc_type in ("disambiguation",)
-                or (SKIP_CATEGORY_DOCS == "1" and doc_type == "category")
-                or (SUMMARIZER_SKIP_LISTS == "1" and doc_type == "list")
-            ):
-                print(f"[summarizer] skip {doc_type or 'unknown'} {url}", flush=True)
-                continue
+_content_hash_re = re.compile(rb'"content_hash"\s*:\s*"([^"]*)"')
 
-            # LANGUAGE NORMALISATION 
-            # Base content fields
-            content_main = (data.get("content") or "").strip()
-            zh_hans_text = (data.get("content_zh_hans") or "").strip()
-            zh_hant_text = (data.get("content_zh_hant") or "").strip()
-            zh_title_hans = (data.get("zh_title_hans") or "").strip() or None
-
-            # strip any leftover wiki [[...]] markup from the raw
-            # article text before sending it to the LLM.
-            content_main = strip_wikilinks_markup(content_main)
-            zh_hans_text = strip_wikilinks_markup(zh_hans_text)
-            zh_hant_text = strip_wikilinks_markup(zh_hant_text)
-
-            # If this JSON is actually a Chinese page and content_zh_* are empty,
-            # treat `content` as Chinese (Simplified) instead of English.
-            is_zh_page = (
-                lang.startswith("zh")
-                or url.startswith("https://zh.wikipedia.org")
-            )
-            is_en_page = (
-                lang.startswith("en")
-                or url.startswith("https://en.wikipedia.org")
+
+def read_content_hash(path: Path, tail_bytes: int = 0) -> str:
+    """
+    Pull the content_hash value out of a JSON file without parsing it.
+    With tail_bytes, only the end of the file is read. Returns "" when the
+    file or key is missing. (Inside JSON string values quotes are escaped,
+    so the pattern can only hit the real key.)
+    """
+    try:
+        with open(path, "rb") as f:
+            if tail_bytes:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - tail_bytes))
+            buf = f.read()
+    except OSError:
+        return ""
+    m = _content_hash_re.search(buf)
+    return m.group(1).decode("utf-8", "replace").strip() if m else ""
+
+
+# clean JSON path -> (clean file, summary file) stat signatures at the time
+# prepare_topic() skipped it (unchanged hash, doc_type, too short). While
+# both still match, later polls skip the topic without reading anything.
+_skipped_signatures: Dict[Path, Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]] = {}
+# what the index file held after the last load/save, as
+# (_clean_records, _skipped_signatures, skip config) copies; None = not loaded yet
+_index_saved: Optional[Tuple[dict, dict, str]] = None
+
+
+def _skip_config() -> str:
+    """The settings prepare_topic()'s skip decisions depend on."""
+    return f"min_chars={MIN_INPUT_CHARS};categories={SKIP_CATEGORY_DOCS};lists={SUMMARIZER_SKIP_LISTS}"
+
+
+# bump when the meaning of a clean_records/skipped row changes; an index
+# written under another version is dropped and rebuilt by the next scan
+_INDEX_SCHEMA_VERSION = "1"
+
+
+def _open_index() -> sqlite3.Connection:
+    SUMMARIZER_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SUMMARIZER_INDEX_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None or row[0] != _INDEX_SCHEMA_VERSION:
+        if row is not None:
+            log(f"[summarizer] index schema {row[0]} -> {_INDEX_SCHEMA_VERSION}; rebuilding it")
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS clean_records")
+            conn.execute("DROP TABLE IF EXISTS skipped")
+            conn.execute("DELETE FROM meta")
+            conn.execute(
+                "INSERT INTO meta VALUES ('schema_version', ?)", (_INDEX_SCHEMA_VERSION,)
             )
+    conn.executescript("""
+    CREATE TABLE IF NOT EXISTS clean_records(
+      path TEXT PRIMARY KEY,
+      mtime_ns INTEGER NOT NULL,
+      size INTEGER NOT NULL,
+      topic_id TEXT NOT NULL,
+      has_zh INTEGER NOT NULL,
+      retrieved_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS skipped(
+      path TEXT PRIMARY KEY,
+      clean_mtime_ns INTEGER NOT NULL,
+      clean_size INTEGER NOT NULL,
+      summary_mtime_ns INTEGER,
+      summary_size INTEGER
+    );
+    """)
+    return conn
+
+
+def load_index() -> None:
+    """
+    Seed _clean_records and _skipped_signatures from SUMMARIZER_INDEX_PATH
+    (once per process), so the first scan after a restart only reads the
+    clean files that changed while the summarizer was down.
+    Skip decisions made under different skip settings are dropped, so
+    those files are checked again under the current ones.
+    """
+    global _index_saved
+    if _index_saved is not None or SUMMARIZER_INDEX != "1":
+        return
+    config = _skip_config()
+    _index_saved = ({}, {}, config)
+    try:
+        conn = _open_index()
+        try:
+            records = conn.execute("SELECT * FROM clean_records").fetchall()
+            skipped = conn.execute("SELECT * FROM skipped").fetchall()
+            row = conn.execute("SELECT value FROM meta WHERE key = 'skip_config'").fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        log(f"[WARN] could not read summarizer index {SUMMARIZER_INDEX_PATH}: {e}")
+        return
+    saved_config = row[0] if row else ""
+    if skipped and saved_config != config:
+        log(
+            f"[summarizer] skip settings changed ({saved_config or 'unknown'} -> {config}); "
+            f"re-checking {len(skipped)} previously skipped files"
+        )
+        skipped = []
+    for path, mtime_ns, size, topic_id, has_zh, retrieved_at in records:
+        path = Path(path)
+        _clean_records.setdefault(
+            path, ((mtime_ns, size), topic_id, (has_zh, retrieved_at, path.name))
+        )
+    for path, c_mtime, c_size, s_mtime, s_size in skipped:
+        summary_sig = (s_mtime, s_size) if s_mtime is not None else None
+        _skipped_signatures.setdefault(Path(path), ((c_mtime, c_size), summary_sig))
+    # a changed config leaves the saved copy stale, so the next save rewrites it
+    _index_saved = (dict(_clean_records), dict(_skipped_signatures), saved_config)
 
-            if is_zh_page and content_main and not (zh_hans_text or zh_hant_text):
-                zh_hans_text = content_main
-                content_main = ""  # do not treat as English
 
-            # English source text: only when it's really an English article
-            en_source = content_main if is_en_page else ""
+def save_index() -> None:
+    """
+    Write _clean_records and _skipped_signatures back to SUMMARIZER_INDEX_PATH
+    if either changed, dropping clean files the last scan no longer saw.
+    """
+    global _index_saved
+    if _index_saved is None or SUMMARIZER_INDEX != "1":
+        return
+    for path in [p for p in _skipped_signatures if p not in _clean_records]:
+        del _skipped_signatures[path]
+    config = _skip_config()
+    if _index_saved == (_clean_records, _skipped_signatures, config):
+        return
+    records = [
+        (str(path), sig[0], sig[1], topic_id, score[0], score[1])
+        for path, (sig, topic_id, score) in _clean_records.items()
+    ]
+    skipped = [
+        (str(path), clean_sig[0], clean_sig[1], *(summary_sig or (None, None)))
+        for path, (clean_sig, summary_sig) in _skipped_signatures.items()
+        if clean_sig is not None
+    ]
+    try:
+        conn = _open_index()
+        try:
+            with conn:
+                conn.execute("DELETE FROM clean_records")
+                conn.executemany("INSERT INTO clean_records VALUES (?, ?, ?, ?, ?, ?)", records)
+                conn.execute("DELETE FROM skipped")
+                conn.executemany("INSERT INTO skipped VALUES (?, ?, ?, ?, ?)", skipped)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('skip_config', ?)", (config,)
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        log(f"[WARN] could not write summarizer index {SUMMARIZER_INDEX_PATH}: {e}")
+        return
+    _index_saved = (dict(_clean_records), dict(_skipped_signatures), config)
+
+
+def list_summary_names() -> set:
+    """Names of the files in SUMMARY_DIR, from one directory read (no stats)."""
+    try:
+        with os.scandir(SUMMARY_DIR) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
 
-            # Short-content guard: if *none* language has enough text, skip
-            if (
-                len(en_source) < MIN_INPUT_CHARS
-                and len(zh_hans_text) < MIN_INPUT_CHARS
-                and len(zh_hant_text) < MIN_INPUT_CHARS
-            ):
-                print(f"[summarizer] too-short content {url}", flush=True)
-                continue
 
-            # relevance gate (heuristics + LLM) before we spend tokens summarizing
-            title = (data.get("title") or "").strip()
-            if not is_relevant_article(
-                url=url,
-                title=title,
-                categories=categories,
-                en_source=en_source,
-                zh_hans_text=zh_hans_text,
-                zh_hant_text=zh_hant_text,
-            ):
-                print(f"[summarizer] filtered as IRRELEVANT: {url}", flush=True)
-                continue
+def prepare_topic(
+    topic_id: str, json_path: Path, summary_names: Optional[set] = None
+) -> Optional[dict]:
+    """
+    Load one topic's best clean JSON and run the cheap local checks
+    (unchanged hash, doc_type, short content, relevance heuristics).
+    Returns a job dict for summarize_topic(), or None if skipped.
+    job["relevance_sample"] is set when the heuristics were inconclusive
+    and the LLM still has to decide relevance.
+    summary_names (from list_summary_names()) lets a topic that has never
+    been summarized skip the stat and read of its missing summary file.
+    """
+    summary_path = SUMMARY_DIR / f"{topic_id}.json"
+    has_summary = summary_names is None or summary_path.name in summary_names
+
+    # Skipped last time and neither file changed since: don't even read it.
+    # Within process_once() (summary_names given) collect_best_clean_paths()
+    # has just stat'ed the clean file, so reuse that.
+    record = _clean_records.get(json_path) if summary_names is not None else None
+    signature = (
+        record[0] if record else _stat_signature(json_path),
+        _stat_signature(summary_path) if has_summary else None,
+    )
+    if _skipped_signatures.get(json_path) == signature:
+        return None
 
-            print(
-                f"[summarizer] Summarizing {json_path.relative_to(DATA_DIR)} "
-                f"(topic_id={topic_id}, lang={lang or 'unknown'}, zh_url={bool(data.get('zh_url'))})",
-                flush=True,
-            )
+    # Every character of the content fields takes at least one byte of the
+    # file, so a file smaller than MIN_INPUT_CHARS can't pass the short-content
+    # guard below; skip it without reading (list/stub pages are common).
+    if signature[0] is not None and signature[0][1] < MIN_INPUT_CHARS:
+        log(f"[summarizer] too-short content {json_path.name} ({signature[0][1]} bytes)")
+        _skipped_signatures[json_path] = signature
+        return None
+
+    # incremental summarization by content_hash + topic_id: compare the
+    # hashes before parsing the (possibly multi-MB) clean document. The
+    # extractor writes content_hash last, so the file tail is enough.
+    old_hash = read_content_hash(summary_path) if has_summary else ""
+    if old_hash and read_content_hash(json_path, tail_bytes=4096) == old_hash:
+        # content unchanged → keep old summaries, skip work
+        log(
+            f"[summarizer] unchanged content_hash for topic_id={topic_id}, "
+            f"skipping re-summarize",
+        )
+        _skipped_signatures[json_path] = signature
+        return None
+
+    try:
+        data = json_loads(json_path.read_bytes())
+    except Exception as e:
+        log(f"[summarizer] skip unreadable clean JSON {json_path}: {e}")
+        return None
+
+    # ensure topic_id is present in the in-memory dict as well
+    topic_id = derive_topic_id(data, json_path)
+    data["topic_id"] = topic_id
 
-            # MULTILINGUAL LOGIC
-            en_summary: Optional[str] = None
-            hans_summary: Optional[str] = None
-            hant_summary: Optional[str] = None
+    # summaries named by topic_id, not raw filename 
+    out_path = SUMMARY_DIR / f"{topic_id}.json"
 
-            have_zh_article = bool(
-                (data.get("zh_url") or "").strip()
-                or zh_hans_text
-                or zh_hant_text
+    try:
+        url = data.get("url") or ""
+        doc_type = (data.get("doc_type") or "").lower()
+        lang = (data.get("lang") or "").lower()
+
+        categories = data.get("categories") or []
+        derived_tags = {
+            CATEGORY_TAG_MAP[cat] for cat in _CATEGORY_TAG_KEYS.intersection(categories)
+        }
+
+        # Always keep a generic 'summary' tag too
+        derived_tags.add("summary")
+        data["tags"] = sorted(derived_tags)
+
+        # same check on the parsed document, for clean files whose
+        # content_hash was not in the tail window
+        clean_hash = (data.get("content_hash") or "").strip()
+        if clean_hash and old_hash and clean_hash == old_hash:
+            log(
+                f"[summarizer] unchanged content_hash for topic_id={topic_id}, "
+                f"skipping re-summarize",
             )
+            _skipped_signatures[json_path] = signature
+            return None
+
+        if (
+            not url
+            or doc_type in ("disambiguation",)
+            or (SKIP_CATEGORY_DOCS == "1" and doc_type == "category")
+            or (SUMMARIZER_SKIP_LISTS == "1" and doc_type == "list")
+        ):
+            log(f"[summarizer] skip {doc_type or 'unknown'} {url}")
+            _skipped_signatures[json_path] = signature
+            return None
+
+        # LANGUAGE NORMALISATION 
+        # Base content fields
+        content_main = (data.get("content") or "").strip()
+        zh_hans_text = (data.get("content_zh_hans") or "").strip()
+        zh_hant_text = (data.get("content_zh_hant") or "").strip()
+        zh_title_hans = (data.get("zh_title_hans") or "").strip() or None
+
+        # strip any leftover wiki [[...]] markup from the raw
+        # article text before sending it to the LLM.
+        content_main = strip_wikilinks_markup(content_main)
+        zh_hans_text = strip_wikilinks_markup(zh_hans_text)
+        zh_hant_text = strip_wikilinks_markup(zh_hant_text)
+
+        # If this JSON is actually a Chinese page and content_zh_* are empty,
+        # treat `content` as Chinese (Simplified) instead of English.
+        is_zh_page = (
+            lang.startswith("zh")
+            or url.startswith("https://zh.wikipedia.org")
+        )
+        is_en_page = (
+            lang.startswith("en")
+            or url.startswith("https://en.wikipedia.org")
+        )
 
-            # 1) Chinese summaries first if there is a zh article
-            if have_zh_article:
-                # Simplified from zh article (preferred); if only zh-hant exists,
-                # we still ask for Simplified output.
-                if len(zh_hans_text) >= MIN_INPUT_CHARS:
-                    hans_summary = summarize_zh(
-                        zh_hans_text, use_trad=False, main_title=zh_title_hans
-                    )
-                elif len(zh_hant_text) >= MIN_INPUT_CHARS:
-                    hans_summary = summarize_zh(
-                        zh_hant_text, use_trad=False, main_title=zh_title_hans
+        if is_zh_page and content_main and not (zh_hans_text or zh_hant_text):
+            zh_hans_text = content_main
+            content_main = ""  # do not treat as English
+
+        # English source text: only when it's really an English article
+        en_source = content_main if is_en_page else ""
+
+        # Short-content guard: if *none* language has enough text, skip
+        if (
+            len(en_source) < MIN_INPUT_CHARS
+            and len(zh_hans_text) < MIN_INPUT_CHARS
+            and len(zh_hant_text) < MIN_INPUT_CHARS
+        ):
+            log(f"[summarizer] too-short content {url}")
+            _skipped_signatures[json_path] = signature
+            return None
+
+        title = (data.get("title") or "").strip()
+        needs_llm = not looks_nanjing_related(
+            url=url,
+            title=title,
+            categories=categories,
+            en_source=en_source,
+            zh_hans_text=zh_hans_text,
+            zh_hant_text=zh_hant_text,
+        )
+
+        return {
+            "topic_id": topic_id,
+            "json_path": json_path,
+            "out_path": out_path,
+            "data": data,
+            "url": url,
+            "lang": lang,
+            "clean_hash": clean_hash,
+            "en_source": en_source,
+            "zh_hans_text": zh_hans_text,
+            "zh_hant_text": zh_hant_text,
+            "zh_title_hans": zh_title_hans,
+            "relevance_sample": (en_source or zh_hans_text or zh_hant_text)
+            if needs_llm else None,
+        }
+
+    except Exception as e:
+        log(f"[WARN] Failed {json_path}: {e}")
+
+    return None
+
+
+def write_summary(out_path: Path, payload: bytes) -> bool:
+    """
+    Write one serialized summary file. Returns True on success.
+    The payload goes to a sibling .tmp file in one write and is then renamed
+    over out_path, so a reader (or a restart after a crash) never sees a
+    half-written summary.
+    """
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, out_path)
+    except OSError as e:
+        log(f"[WARN] Failed to write {out_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    log(f"[summarizer] ✅ Saved summary to {out_path}")
+    return True
+
+
+# full article text from the clean record; the publisher only needs the
+# summaries and metadata, so these are left out of the summary file
+_SOURCE_TEXT_FIELDS = frozenset(("content", "content_zh_hans", "content_zh_hant"))
+
+
+def summarize_topic(job: dict, write=write_summary) -> bool:
+    """
+    Generate the multilingual summaries for a prepared job and write its
+    summary file. Returns True if a summary was written.
+    Safe to run concurrently for different topics.
+    write(out_path, payload) stores the serialized summary; process_once()
+    passes one that hands it to a writer thread and returns True at once.
+    """
+    topic_id = job["topic_id"]
+    json_path = job["json_path"]
+    out_path = job["out_path"]
+    data = job["data"]
+    lang = job["lang"]
+    clean_hash = job["clean_hash"]
+    en_source = job["en_source"]
+    zh_hans_text = job["zh_hans_text"]
+    zh_hant_text = job["zh_hant_text"]
+    zh_title_hans = job["zh_title_hans"]
+
+    try:
+        log(
+            f"[summarizer] Summarizing {json_path.relative_to(DATA_DIR)} "
+            f"(topic_id={topic_id}, lang={lang or 'unknown'}, zh_url={bool(data.get('zh_url'))})",
+        )
+
+        # MULTILINGUAL LOGIC
+        en_summary: Optional[str] = None
+        hans_summary: Optional[str] = None
+        hant_summary: Optional[str] = None
+
+        have_zh_article = bool(
+            (data.get("zh_url") or "").strip()
+            or zh_hans_text
+            or zh_hant_text
+        )
+
+        # 1) Independent first-pass summaries, issued in parallel:
+        #    Simplified from the zh article, English from the en article.
+        zh_source = ""
+        if have_zh_article:
+            # Simplified from zh article (preferred); if only zh-hant exists,
+            # we still ask for Simplified output.
+            if len(zh_hans_text) >= MIN_INPUT_CHARS:
+                zh_source = zh_hans_text
+            elif len(zh_hant_text) >= MIN_INPUT_CHARS:
+                zh_source = zh_hant_text
+
+        # Rule: English from English article if it exists; otherwise from Chinese.
+        # (process_once may already have summarized it in a batch)
+        hans_summary, en_summary = run_parallel(
+            (lambda: summarize_zh(zh_source, use_trad=False, main_title=zh_title_hans))
+            if zh_source else None,
+            (lambda: summarize_en(en_source))
+            if len(en_source) >= MIN_INPUT_CHARS and not job.get("en_summary") else None,
+        )
+        en_summary = en_summary or job.get("en_summary")
+
+        # 2) Everything that only needs the Simplified summary, in parallel:
+        #    Traditional via Hans→Hant conversion, and (no English article)
+        #    English derived from the Chinese summary.
+        if hans_summary:
+            hant_summary, en_from_zh = run_parallel(
+                lambda: convert_hans_to_hant(hans_summary),
+                (lambda: translate_en_from_zh(hans_summary))
+                if not en_summary else None,
+            )
+            en_summary = en_summary or en_from_zh
+
+        # 3) If there is NO Chinese article at all, generate Chinese
+        # summaries purely by translating the English summary.
+        if not have_zh_article:
+            if en_summary:
+                # For the "no Chinese article" case, spec says:
+                # translate English separately into both Hans and Hant,
+                # not Hans→Hant conversion. Both only need en_summary, so
+                # one fused call asks for both; whatever it doesn't deliver
+                # is translated on its own below.
+                if LLM_FUSED_ZH == "1" and not hans_summary and not hant_summary:
+                    hans_summary, hant_summary = translate_zh_pair_from_en(
+                        en_summary, main_title=zh_title_hans
                     )
+                hans_new, hant_new = run_parallel(
+                    (lambda: translate_zh_from_en(
+                        en_summary, use_trad=False, main_title=zh_title_hans
+                    )) if not hans_summary else None,
+                    (lambda: translate_zh_from_en(
+                        en_summary, use_trad=True, main_title=zh_title_hans
+                    )) if not hant_summary else None,
+                )
+                hans_summary = hans_summary or hans_new
+                hant_summary = hant_summary or hant_new
 
-                # Traditional: if we have Hans, convert; otherwise we may later
-                # fall back from English.
+        else:
+            # There *is* a Chinese article but we may still be missing Hans/Hant
+            # (e.g. Chinese text too short). In that case, use English summary
+            # as the fallback source according to your rules.
+
+            # Simplified Chinese: from zh article when possible, otherwise from EN.
+            if not hans_summary and en_summary:
+                hans_summary = translate_zh_from_en(
+                    en_summary, use_trad=False, main_title=zh_title_hans
+                )
+
+            # Traditional Chinese:
+            # - if we have a Hans summary (from zh article or EN), prefer converting Hans→Hant
+            # - otherwise, translate from EN directly.
+            if not hant_summary:
                 if hans_summary:
                     hant_summary = convert_hans_to_hant(hans_summary)
+                elif en_summary:
+                    hant_summary = translate_zh_from_en(
+                        en_summary, use_trad=True, main_title=zh_title_hans
+                    )
 
-            # 2) English summary
-            # Rule: from English article if it exists; otherwise from Chinese.
-            if len(en_source) >= MIN_INPUT_CHARS:
-                en_summary = summarize_en(en_source)
+        # strip any [[...]] from LLM outputs
+        en_summary   = cleanup_inline_links(en_summary,   "en")
+        hans_summary = cleanup_inline_links(hans_summary, "zh_hans")
+        hant_summary = cleanup_inline_links(hant_summary, "zh_hant")
 
-            if not en_summary:
-                # No English article → derive from Chinese summary
-                if hans_summary:
-                    en_summary = translate_en_from_zh(hans_summary)
-                elif hant_summary:
-                    en_summary = translate_en_from_zh(hant_summary)
+        # Cleanup Chinese note lines
+        hans_summary = strip_chinese_notes(hans_summary)
+        hant_summary = strip_chinese_notes(hant_summary)
 
-            # 3) If there is NO Chinese article at all, generate Chinese
-            # summaries purely by translating the English summary.
-            if not have_zh_article:
+        # Final safety: ensure we *do* have an English summary.
+        if not en_summary:
+            chinese_source_for_en = hans_summary or hant_summary
+            if chinese_source_for_en:
+                en_summary = translate_en_from_zh(chinese_source_for_en)
                 if en_summary:
-                    if not hans_summary:
-                        hans_summary = translate_zh_from_en(
-                            en_summary, use_trad=False, main_title=zh_title_hans
-                        )
-                    if not hant_summary:
-                        # For the "no Chinese article" case, spec says:
-                        # translate English separately into both Hans and Hant,
-                        # not Hans→Hant conversion.
-                        hant_summary = translate_zh_from_en(
-                            en_summary, use_trad=True, main_title=zh_title_hans
-                        )
+                    en_summary = en_summary.strip()
+
+        # as a last step, strip any leftover [[...]] markup
+        # from summaries themselves, in case the LLM ever emits it.
+        en_summary   = strip_wikilinks_markup(en_summary)
+        hans_summary = strip_wikilinks_markup(hans_summary)
+        hant_summary = strip_wikilinks_markup(hant_summary)
+
+        # prepare_topic() only passes jobs with enough source text, so no
+        # summary at all means the LLM calls failed; don't record the
+        # content_hash, or the topic would never be summarized again
+        if not (en_summary or hans_summary or hant_summary):
+            log(f"[WARN] no summary produced for {json_path}; will retry")
+            return False
+
+        data["summary_en"] = en_summary
+        data["summary_zh_hans"] = hans_summary
+        data["summary_zh_hant"] = hant_summary
+
+        # persist content_hash + last_summarized_at into summary JSON
+        if clean_hash:
+            data["content_hash"] = clean_hash
+        data["last_summarized_at"] = (
+            job.get("summarized_at") or datetime.now(timezone.utc).isoformat()
+        )
 
-            else:
-                # There *is* a Chinese article but we may still be missing Hans/Hant
-                # (e.g. Chinese text too short). In that case, use English summary
-                # as the fallback source according to your rules.
+        # keep topic_id in the output JSON for publisher
+        data["topic_id"] = topic_id
 
-                # Simplified Chinese: from zh article when possible, otherwise from EN.
-                if not hans_summary and en_summary:
-                    hans_summary = translate_zh_from_en(
-                        en_summary, use_trad=False, main_title=zh_title_hans
-                    )
+        out = {k: v for k, v in data.items() if k not in _SOURCE_TEXT_FIELDS}
+        payload = json_dumps_bytes(out)
+        return write(out_path, payload)
 
-                # Traditional Chinese:
-                # - if we have a Hans summary (from zh article or EN), prefer converting Hans→Hant
-                # - otherwise, translate from EN directly.
-                if not hant_summary:
-                    if hans_summary:
-                        hant_summary = convert_hans_to_hant(hans_summary)
-                    elif en_summary:
-                        hant_summary = translate_zh_from_en(
-                            en_summary, use_trad=True, main_title=zh_title_hans
-                        )
-
-            # strip any [[...]] from LLM outputs
-            en_summary   = cleanup_inline_links(en_summary,   "en")
-            hans_summary = cleanup_inline_links(hans_summary, "zh_hans")
-            hant_summary = cleanup_inline_links(hant_summary, "zh_hant")
-
-            # Cleanup Chinese note lines
-            hans_summary = strip_chinese_notes(hans_summary)
-            hant_summary = strip_chinese_notes(hant_summary)
-
-            # Final safety: ensure we *do* have an English summary.
-            if not en_summary:
-                chinese_source_for_en = hans_summary or hant_summary
-                if chinese_source_for_en:
-                    en_summary = translate_en_from_zh(chinese_source_for_en)
-                    if en_summary:
-                        en_summary = en_summary.strip()
-
-            # as a last step, strip any leftover [[...]] markup
-            # from summaries themselves, in case the LLM ever emits it.
-            en_summary   = strip_wikilinks_markup(en_summary)
-            hans_summary = strip_wikilinks_markup(hans_summary)
-            hant_summary = strip_wikilinks_markup(hant_summary)
-
-            data["summary_en"] = en_summary
-            data["summary_zh_hans"] = hans_summary
-            data["summary_zh_hant"] = hant_summary
-
-            # persist content_hash + last_summarized_at into summary JSON
-            if clean_hash:
-                data["content_hash"] = clean_hash
-            data["last_summarized_at"] = datetime.now(timezone.utc).isoformat()
-
-            # keep topic_id in the output JSON for publisher
-            data["topic_id"] = topic_id
-
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            print(f"[summarizer] ✅ Saved summary to {out_path}", flush=True)
-            wrote += 1
+    except Exception as e:
+        log(f"[WARN] Failed {json_path}: {e}")
 
-        except Exception as e:
-            print(f"[WARN] Failed {json_path}: {e}", flush=True)
+    return False
+
+
+def process_topic(topic_id: str, json_path: Path) -> bool:
+    """
+    Summarize one topic's best clean JSON and write its summary file.
+    Returns True if a summary was written, False if it was skipped.
+    """
+    job = prepare_topic(topic_id, json_path)
+    if not job:
+        return False
+    sample = job["relevance_sample"]
+    if sample is not None and not classify_relevance_with_llm(sample):
+        log(f"[summarizer] filtered as IRRELEVANT: {job['url']}")
+        return False
+    return summarize_topic(job)
+
+
+def process_once(changed_paths: Optional[set] = None, failed: Optional[set] = None) -> int:
+    """
+    Summarize every topic whose best clean JSON needs it, or only those
+    whose best file is in changed_paths. Returns the number of summaries
+    written; clean paths whose summary failed are added to failed.
+    """
+    load_index()
+
+    # only process one best clean JSON per topic_id 
+    best_paths = collect_best_clean_paths()
+    items = sorted(best_paths.items())
+    if changed_paths is not None:
+        # watcher pass: only topics whose best file is one that changed
+        items = [(t, p) for t, p in items if p in changed_paths]
+
+    # Topics are independent and the work is dominated by waiting on the
+    # LLM, so run several topics at once on worker threads. Jobs are handed
+    # to the pool as soon as they are ready, so summarizing starts while the
+    # remaining topics are still being read and checked.
+    pool = None
+    if SUMMARIZER_CONCURRENCY > 1 and len(items) > 1:
+        pool = ThreadPoolExecutor(
+            max_workers=SUMMARIZER_CONCURRENCY, thread_name_prefix="summarizer"
+        )
+    results = []  # summarize_topic futures (pooled only)
+
+    # one timestamp for the whole pass; it only marks which run wrote it
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    # Summary files are written by one background thread, so a topic worker
+    # goes straight back to LLM work instead of waiting on the disk. The
+    # pass only returns once every queued write has finished.
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarizer-writer")
+    writes = []
+
+    def _queue_write(out_path: Path, payload: bytes) -> bool:
+        writes.append(writer.submit(write_summary, out_path, payload))
+        return True
+
+    def _summarize(job: dict) -> bool:
+        ok = summarize_topic(job, _queue_write)
+        if not ok and failed is not None:
+            failed.add(job["json_path"])
+        return ok
+
+    def _submit(job: dict) -> None:
+        if pool is None:
+            _summarize(job)
+        else:
+            results.append(pool.submit(_summarize, job))
+
+    # With SUMMARIZER_BATCH > 1, jobs with an English article wait until
+    # that many are ready, get their English summaries from one call, and
+    # then go to the pool with job["en_summary"] filled in.
+    en_batch: list[dict] = []
+
+    def _flush_en_batch() -> None:
+        summaries = summarize_en_batch([job["en_source"] for job in en_batch])
+        for job, summary in zip(en_batch, summaries):
+            if summary:
+                job["en_summary"] = summary
+            _submit(job)
+        en_batch.clear()
+
+    def _dispatch(job: dict) -> None:
+        job["summarized_at"] = now_iso
+        if SUMMARIZER_BATCH > 1 and len(job["en_source"]) >= MIN_INPUT_CHARS:
+            en_batch.append(job)
+            if len(en_batch) >= SUMMARIZER_BATCH:
+                _flush_en_batch()
+            return
+        _submit(job)
+
+    # Relevance for articles the heuristics could not decide: ask the LLM
+    # about RELEVANCE_BATCH_SIZE of them per call instead of one each.
+    batch_size = max(1, RELEVANCE_BATCH_SIZE)
+    pending: list[dict] = []
+
+    def _flush_relevance() -> None:
+        verdicts = classify_relevance_batch([job["relevance_sample"] for job in pending])
+        for job, ok in zip(pending, verdicts):
+            if ok:
+                _dispatch(job)
+            else:
+                log(f"[summarizer] filtered as IRRELEVANT: {job['url']}")
+        pending.clear()
+
+    # one directory read instead of a stat per never-summarized topic
+    summary_names = list_summary_names()
 
-    return wrote
+    try:
+        for topic_id, json_path in items:
+            job = prepare_topic(topic_id, json_path, summary_names)
+            if not job:
+                continue
+            if job["relevance_sample"] is None:
+                _dispatch(job)
+                continue
+            pending.append(job)
+            if len(pending) >= batch_size:
+                _flush_relevance()
+        if pending:
+            _flush_relevance()
+        if en_batch:
+            _flush_en_batch()
+
+        for fut in results:
+            fut.result()
+        return sum(1 for fut in writes if fut.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+        writer.shutdown(wait=True)
+        save_index()
+        peak = _reset_in_flight_peak()
+        if peak:
+            log(f"[summarizer] peak LLM calls in flight this pass: {peak}")
 
 # to make automation + services play nicely together
 RUN_ONCE = os.getenv("RUN_ONCE") == "1"   # (existing)
 
+
+def run_watch_loop() -> None:
+    """
+    Block on filesystem events for CLEAN_DIR and summarize only the clean
+    JSONs that were added or modified. A full process_once() runs at
+    start-up and again every FULL_SWEEP_INTERVAL seconds. Topics whose
+    summary failed (e.g. the LLM was unreachable) are retried every
+    INTERVAL seconds instead of waiting for the next full sweep.
+    """
+    CLEAN_DIR.mkdir(parents=True, exist_ok=True)
+    root = CLEAN_DIR.resolve()
+    retry: set = set()
+    process_once(failed=retry)
+    last_sweep = time.monotonic()
+    for changes in watch_files(
+        CLEAN_DIR,
+        watch_filter=lambda change, path: path.endswith(".json"),
+        rust_timeout=min(INTERVAL, FULL_SWEEP_INTERVAL) * 1000,
+        yield_on_timeout=True,
+    ):
+        if time.monotonic() - last_sweep >= FULL_SWEEP_INTERVAL:
+            retry = set()
+            process_once(failed=retry)
+            last_sweep = time.monotonic()
+            continue
+        # map event paths back onto CLEAN_DIR as collect_best_clean_paths()
+        # spells it, so membership checks match
+        changed = set()
+        for change, path in changes:
+            if change == Change.deleted:
+                continue
+            try:
+                changed.add(CLEAN_DIR / Path(path).resolve().relative_to(root))
+            except ValueError:
+                continue
+        if changed or retry:
+            changed |= retry
+            retry = set()
+            process_once(changed_paths=changed, failed=retry)
+
 if __name__ == "__main__":
-    print(f"Summarizer service running... (model={MODEL_NAME})", flush=True)
-    print(f"Connecting to LLM at {LLM_BASE_URL}", flush=True)
-    try:
-        models = client.models.list()
-        print(f"LLM reachable, {len(models.data)} models available.", flush=True)
-    except Exception as e:
-        print(f"[WARN] Could not verify LLM: {e}", flush=True)
+    log(f"Summarizer service running... (model={MODEL_NAME})")
+    log(f"Connecting to LLM at {LLM_BASE_URL}")
+    if VERIFY_LLM == "1":
+        try:
+            models = client.models.list()
+            log(f"LLM reachable, {len(models.data)} models available.")
+            if MODEL_NAME not in {m.id for m in models.data}:
+                log(f"[WARN] model {MODEL_NAME!r} is not listed by the LLM server")
+        except Exception as e:
+            log(f"[WARN] Could not verify LLM: {e}")
 
     SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
     try:  # catch KeyboardInterrupt
         if RUN_ONCE:
             process_once()  # (existing)
+        elif WATCH_CLEAN_DIR == "1" and watch_files is not None:
+            log(f"[summarizer] watching {CLEAN_DIR} for changes")
+            run_watch_loop()
         else:
             while True:
                 n = process_once()  # (existing)
                 if n == 0:
                     time.sleep(INTERVAL)  # (existing)
     except KeyboardInterrupt:
-        print("Summarizer interrupted; shutting down...", flush=True)  
+        log("Summarizer interrupted; shutting down...")  
     sys.exit(0)
@@ -3,6 +3,7 @@
 
 # Comprehensive test for publisher/app.py
 
+import gzip
 import importlib
 import json
 import os
@@ -163,6 +164,14 @@ def test_autolink_en_word_boundary_and_punctuation():
     # ensure we link at word boundaries and not inside hyphenated concatenations wrongly
     assert "[[Nanjing University]]" in out
 
+# A shorter title is not linked again inside a longer linked title.
+def test_autolink_en_links_longest_title_once():
+    text = "See Nanjing Museum in Nanjing."
+    out = pub.autolink_en(text, ["Nanjing", "Nanjing Museum"], current_title="Other")
+    assert out.count("<$link") == 2
+    assert '<$link to="Nanjing Museum">Nanjing Museum</$link>' in out
+    assert '<$link to="Nanjing">Nanjing</$link>.' in out
+
 # Autolinks known Chinese titles.
 def test_autolink_zh_basic_and_skip_current():
     zh_text = "我想去 南京博物馆 看看。"
@@ -174,6 +183,14 @@ def test_autolink_zh_basic_and_skip_current():
     assert "[[南京博物馆|Nanjing Museum]]" not in out2
 
 
+# Chinese autolinking keeps existing links and prefers the longest phrase.
+def test_autolink_zh_single_pass_longest_phrase():
+    zh_text = '去南京博物馆。<$link to="X">南京</$link>'
+    zh_titles = [("南京博物馆", "Nanjing Museum"), ("南京", "Nanjing")]
+    out = pub.autolink_zh(zh_text, zh_titles, current_title="Other")
+    assert out == '去<$link to="Nanjing Museum">南京博物馆</$link>。<$link to="X">南京</$link>'
+
+
 # Tests for build_title_index
 
 def test_build_title_index_with_various_json(clean_env):
@@ -205,6 +222,30 @@ def test_build_title_index_tunnel_special_case(clean_env):
     assert "Nanjing Yingtian Avenue Yangtze River Tunnel" in en_titles
 
 
+# Repeat calls with unchanged summaries are served from memory or the
+# disk cache; touching a summary invalidates both.
+def test_build_title_index_uses_disk_cache(clean_env, capsys):
+    sdir = clean_env["summarized"]
+    (sdir / "a.json").write_text(json.dumps({"title": "Alpha", "summary_en": "A."}), encoding="utf-8")
+
+    first = pub.build_title_index()
+    assert pub.TITLE_INDEX_CACHE.exists()
+    capsys.readouterr()
+
+    # same process: served from memory, no disk read
+    assert pub.build_title_index() == first
+    assert "Reusing cached title index" not in capsys.readouterr().out
+
+    # fresh process: served from the disk cache
+    pub._title_index_memo.clear()
+    assert pub.build_title_index() == first
+    assert "Reusing cached title index" in capsys.readouterr().out
+
+    (sdir / "b.json").write_text(json.dumps({"title": "Beta", "summary_en": "B."}), encoding="utf-8")
+    en_titles, _ = pub.build_title_index()
+    assert "Beta" in en_titles
+
+
 # Tests for create_tiddlers (many flows)
 
 # write a JSON file to summarized dir
@@ -282,6 +323,100 @@ def test_create_tiddlers_title_derived_when_title_is_chinese(clean_env):
     # Should contain derived English title
     assert "Nanjing Station" in content or "Nanjing" in content
 
+# The process pool renders the same tiddlers as the in-process path.
+def test_create_tiddlers_process_pool_matches_serial(clean_env, monkeypatch):
+    sdir = clean_env["summarized"]
+    tiddlers_dir = Path(os.environ["WIKI_WORKDIR"]) / "tiddlers"
+    for i in range(3):
+        _write_json(sdir, f"t{i}.json", {
+            "title": f"Topic {i}",
+            "summary_en": f"Topic {i} mentions Topic {(i + 1) % 3}.",
+            "summary_zh_hans": "南京",
+        })
+    importlib.reload(pub)
+    en_titles, zh_titles = pub.build_title_index()
+
+    monkeypatch.setattr(pub, "PUBLISHER_WORKERS", 1)
+    assert pub.create_tiddlers(en_titles, zh_titles) == 3
+    serial = {f.name: f.read_bytes() for f in tiddlers_dir.glob("*.tid")}
+    for f in tiddlers_dir.glob("*.tid"):
+        f.unlink()
+
+    monkeypatch.setattr(pub, "PUBLISHER_WORKERS", 2)
+    monkeypatch.setattr(pub, "PARALLEL_RENDER_MIN_TOPICS", 1)
+    assert pub.create_tiddlers(en_titles, zh_titles) == 3
+    pooled = {f.name: f.read_bytes() for f in tiddlers_dir.glob("*.tid")}
+
+    # created/modified stamps may differ by a second between the two runs
+    strip = lambda b: re.sub(rb"(created|modified): \d+", b"", b)
+    assert {k: strip(v) for k, v in serial.items()} == {k: strip(v) for k, v in pooled.items()}
+
+
+# Render notes from worker processes are printed by the parent, in topic order.
+def test_create_tiddlers_process_pool_prints_notes_in_order(clean_env, monkeypatch, capsys):
+    sdir = clean_env["summarized"]
+    for i in range(4):
+        _write_json(sdir, f"t{i}.json", {
+            "title": f"Topic {i}",
+            "summary_en": "南京是江苏省的省会，也是一座历史文化名城。",
+        })
+    importlib.reload(pub)
+    en_titles, zh_titles = pub.build_title_index()
+
+    monkeypatch.setattr(pub, "PUBLISHER_WORKERS", 2)
+    monkeypatch.setattr(pub, "PARALLEL_RENDER_MIN_TOPICS", 1)
+    capsys.readouterr()
+    assert pub.create_tiddlers(en_titles, zh_titles) == 4
+
+    notes = [line for line in capsys.readouterr().out.splitlines() if "looks Chinese" in line]
+    assert notes == [
+        f"[publisher] summary_en looks Chinese for 'Topic {i}', disabling English body"
+        for i in range(4)
+    ]
+
+
+# A pool that can't start, or that breaks mid-build, falls back to rendering in-process.
+def test_create_tiddlers_process_pool_failure_falls_back(clean_env, monkeypatch, capsys):
+    from concurrent.futures.process import BrokenProcessPool
+
+    sdir = clean_env["summarized"]
+    tiddlers_dir = Path(os.environ["WIKI_WORKDIR"]) / "tiddlers"
+    for i in range(3):
+        _write_json(sdir, f"t{i}.json", {"title": f"Topic {i}", "summary_en": f"Topic {i}."})
+    importlib.reload(pub)
+    en_titles, zh_titles = pub.build_title_index()
+    monkeypatch.setattr(pub, "PUBLISHER_WORKERS", 2)
+    monkeypatch.setattr(pub, "PARALLEL_RENDER_MIN_TOPICS", 1)
+
+    def no_pool(**kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(pub, "ProcessPoolExecutor", no_pool)
+    assert pub.create_tiddlers(en_titles, zh_titles) == 3
+    assert "rendering the remaining 3 topics in-process" in capsys.readouterr().out
+    for f in tiddlers_dir.glob("*.tid"):
+        f.unlink()
+
+    class BreakingPool:
+        def __init__(self, initializer, initargs, **kwargs):
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, items, chunksize=1):
+            yield fn(items[0])
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(pub, "ProcessPoolExecutor", BreakingPool)
+    assert pub.create_tiddlers(en_titles, zh_titles) == 3
+    assert "rendering the remaining 2 topics in-process" in capsys.readouterr().out
+    assert len(list(tiddlers_dir.glob("*.tid"))) == 3
+
+
 # Creates invalid JSON file, ensure that it is skipped without exceptions.
 def test_create_tiddlers_handles_malformed_json_cleanly(clean_env, capsys):
     sdir = clean_env["summarized"]
@@ -348,6 +483,24 @@ def test_inject_tiddlers_writes_many_helpers(clean_env):
         assert (tdir / fn).exists(), f"{fn} missing"
 
 
+# The Recent date heading is chosen per language, not hardcoded in English.
+def test_inject_tiddlers_date_format_per_language(clean_env):
+    workdir = Path(os.environ["WIKI_WORKDIR"])
+    importlib.reload(pub)
+    pub.inject_tiddlers()
+    tdir = workdir / "tiddlers"
+    assert "YYYY年0MM月0DD日" in (tdir / "__date-format.zh-hans.tid").read_text(encoding="utf-8")
+    assert "YYYY年0MM月0DD日" in (tdir / "__date-format.zh-hant.tid").read_text(encoding="utf-8")
+    assert not (tdir / "__date-format.en.tid").exists()
+    recent = next(
+        f.read_text(encoding="utf-8") for f in tdir.glob("*.tid")
+        if "title: $:/core/ui/SideBar/Recent" in f.read_text(encoding="utf-8")
+    )
+    assert "{$:/language/RecentChanges/DateFormat}" in recent
+    assert "~[[YYYY-0MM-0DD]]" in recent
+    assert "DDth MMM YYYY" not in recent
+
+
 # Verify that create_homepage creates index.html with expected content.
 def test_create_homepage_and_content_written(clean_env):
     site = Path(os.environ["SITE_DIR"])
@@ -358,6 +511,22 @@ def test_create_homepage_and_content_written(clean_env):
     content = idx.read_text(encoding="utf-8")
     assert "<title>Nanjing Knowledge Hub</title>" in content or "Nanjing Knowledge Hub Wiki" in content
     assert "search-container" in content
+    # search runs in a worker that shares its matching code with the page
+    assert (site / "output" / "search-worker.js").exists()
+    assert (site / "output" / "search-core.js").exists()
+    assert 'importScripts("search-core.js")' in (site / "output" / "search-worker.js").read_text(encoding="utf-8")
+
+
+# A republish with the same template leaves index.html untouched.
+def test_create_homepage_skips_unchanged_write(clean_env, capsys):
+    site = Path(os.environ["SITE_DIR"])
+    importlib.reload(pub)
+    pub.create_homepage()
+    idx = site / "index.html"
+    os.utime(idx, ns=(1_000_000_000, 1_000_000_000))
+    pub.create_homepage()
+    assert idx.stat().st_mtime_ns == 1_000_000_000
+    assert "unchanged" in capsys.readouterr().out
 
 
 # Verify that inject_search_handler creates the plugin file.
@@ -389,6 +558,13 @@ def test_generate_summaries_output_creates_sorted_json(clean_env):
     # Should be sorted by title case-insensitively: A, B, C
     titles = [d["title"] for d in data]
     assert titles == sorted(titles, key=lambda x: x.lower())
+    # compact output plus an identical gzip sibling
+    raw = out.read_bytes()
+    assert b"\n" not in raw
+    assert gzip.decompress((site / "output" / "summaries.json.gz").read_bytes()) == raw
+    # search fields are pre-lowercased for the homepage filter
+    assert data[0]["title_lc"] == "a title"
+    assert data[0]["summary_lc"] == "a summary"
 
 
 # Creates invalid JSON file, ensure that it is skipped.
@@ -402,6 +578,19 @@ def test_generate_summaries_output_skips_invalid_json_and_logs(clean_env, capsys
     assert "skipping bad.json" in captured.out.lower() or "skipping" in captured.out.lower()
 
 
+# JSON helpers accept a BOM and agree with or without orjson.
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_bytes_helpers_with_and_without_orjson(clean_env, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(pub, "orjson", None)
+    elif pub.orjson is None:
+        pytest.skip("orjson not installed")
+    obj = {"title": "南京", "n": [1, 2]}
+    raw = pub.json_dumps_bytes(obj)
+    assert raw == '{"title":"南京","n":[1,2]}'.encode("utf-8")
+    assert pub.json_loads_bytes(b"\xef\xbb\xbf" + raw) == obj
+
+
 # Tests for build_wiki and main (mocking subprocess.run)
 
 # Mock process to ensure build_wiki runs subprocess.run.
@@ -417,6 +606,29 @@ def test_build_wiki_runs_tiddlywiki_and_cp(mock_run, clean_env):
     assert mock_run.called
 
 
+# build_wiki clears old wiki output but keeps the homepage search scripts,
+# so a rebuild with unchanged scripts leaves their mtime alone.
+@patch("subprocess.run")
+def test_build_wiki_keeps_unchanged_search_scripts(mock_run, clean_env):
+    sdir = clean_env["summarized"]
+    site = Path(os.environ["SITE_DIR"])
+    _write_json(sdir, "one.json", {"title": "One", "summary_en": "One summary"})
+    importlib.reload(pub)
+    mock_run.return_value = MagicMock()
+
+    pub.create_homepage()
+    core = site / "output" / "search-core.js"
+    os.utime(core, ns=(1_000_000_000, 1_000_000_000))
+    stale = site / "output" / "stale.html"
+    stale.write_text("old", encoding="utf-8")
+
+    pub.build_wiki()
+    pub.create_homepage()
+
+    assert not stale.exists()
+    assert core.stat().st_mtime_ns == 1_000_000_000
+
+
 # Test that main calls all steps and creates expected files.
 @patch("subprocess.run")
 def test_main_calls_all_steps_and_creates_files(mock_run, clean_env):
@@ -435,6 +647,20 @@ def test_main_calls_all_steps_and_creates_files(mock_run, clean_env):
     assert (site / "output" / "summaries.json").exists()
 
 
+# main() parses each summary file once and shares it across the steps.
+@patch("subprocess.run")
+def test_main_parses_summaries_once(mock_run, clean_env):
+    sdir = clean_env["summarized"]
+    _write_json(sdir, "one.json", {"title": "One", "summary_en": "One summary", "tags": ["历史"]})
+    importlib.reload(pub)
+    mock_run.return_value = MagicMock()
+
+    real_load = pub.load_all_summaries
+    with patch.object(pub, "load_all_summaries", side_effect=real_load) as loader:
+        pub.main()
+    assert loader.call_count == 1
+
+
 # Additional edge-case tests and fuzzing-ish checks
 
 # Ensure that autolink_en does not create overlapping links.
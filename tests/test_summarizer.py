@@ -30,9 +30,15 @@ to the OpenAI client are mocked so no LLM is required.
 """
 
 import json
+import sqlite3
+import orjson
+import httpx
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from openai import RateLimitError
+
+import summarizer.app as summarizer_app
 
 # Import the summarizer functions
 from summarizer.app import (
@@ -41,9 +47,33 @@ from summarizer.app import (
     process_once,
     summarize_en,
     chat_once,
+    run_parallel,
+    classify_relevance_batch,
+    _smart_truncate,
+    prepare_topic,
+    translate_zh_pair_from_en,
+    translate_zh_from_en,
+    summarize_en_batch,
+    summarize_zh,
+    write_summary,
+    load_index,
+    save_index,
+    collect_best_clean_paths,
+    json_loads,
+    json_dumps_bytes,
 )
 
 
+# --------------------------------------------------------
+# Keep the on-disk LLM reply cache and skip index out of /data
+# and fresh per test, so mocked replies never leak between tests.
+# --------------------------------------------------------
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.LLM_CACHE_DIR", tmp_path / "llm_cache")
+    monkeypatch.setattr("summarizer.app.SUMMARIZER_INDEX_PATH", tmp_path / "index.sqlite")
+
+
 # --------------------------------------------------------
 # Helper function: writes a clean JSON file into the mocked
 # clean directory (tmp_path) to simulate crawler output.
@@ -161,6 +191,7 @@ def test_summarize_en_calls_llm(mock_llm):
 #   - process_once returns 1 (one summary written)
 #   - summarized/big_article.json is created
 #   - JSON contains summary_en = "Fake summary"
+#   - the article text itself is not copied into the summary
 # --------------------------------------------------------
 @patch("summarizer.app.client.chat.completions.create")
 def test_process_once_generates_summary(mock_llm, tmp_path, monkeypatch):
@@ -190,3 +221,601 @@ def test_process_once_generates_summary(mock_llm, tmp_path, monkeypatch):
 
     data = json.loads(out_file.read_text(encoding="utf-8"))
     assert data["summary_en"] == "Fake summary"
+    assert "content" not in data
+
+
+# --------------------------------------------------------
+# TEST 6:
+# run_parallel should return results in call order and
+# yield None for skipped (None) entries.
+# --------------------------------------------------------
+def test_run_parallel_keeps_order_and_skips_none():
+    out = run_parallel(lambda: "a", None, lambda: "c")
+    assert out == ["a", None, "c"]
+    assert run_parallel(None, None) == [None, None]
+
+
+# --------------------------------------------------------
+# TEST 7:
+# classify_relevance_batch should ask about several snippets
+# in one LLM call and map the numbered reply lines back.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_classify_relevance_batch_single_call(mock_llm):
+    mock_llm.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(
+            content="1: RELEVANT\n2: IRRELEVANT\n3: relevant"
+        ))]
+    )
+    out = classify_relevance_batch(["Confucius Temple", "Paris metro", "", "Xuanwu Lake"])
+    assert out == [True, False, True, True]
+    assert mock_llm.call_count == 1
+
+
+# --------------------------------------------------------
+# TEST 8:
+# chat_once should answer a repeated prompt from the disk
+# cache without calling the LLM again.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_reuses_cached_reply(mock_llm, tmp_path):
+    mock_llm.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Cached reply"))]
+    )
+    assert chat_once("sys", "same input") == "Cached reply"
+    assert chat_once("sys", "same input") == "Cached reply"
+    assert mock_llm.call_count == 1
+    assert list((tmp_path / "llm_cache").rglob("*.txt"))
+
+
+# --------------------------------------------------------
+# TEST 9:
+# A clean file that was skipped and has not changed since
+# should not be read or parsed again on the next poll.
+# --------------------------------------------------------
+@patch("summarizer.app.client")
+def test_process_once_does_not_reparse_unchanged_skipped_file(mock_client, tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+
+    write_clean_file(tmp_path, "short_article", {
+        "url": "https://example.com",
+        "doc_type": "article",
+        "lang": "en",
+        "content": "Too short.",
+        "categories": []
+    })
+    assert process_once() == 0
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    assert process_once() == 0
+    assert loads.call_count == 0
+
+
+# --------------------------------------------------------
+# TEST 10:
+# _smart_truncate should stop on a sentence end rather than
+# mid-word, and hard-cut only when there is no boundary.
+# --------------------------------------------------------
+def test_smart_truncate_prefers_sentence_boundary():
+    text = "a" * 70 + ". " + "b" * 50
+    assert _smart_truncate(text, 100) == "a" * 70 + "."
+    assert _smart_truncate("x" * 200, 100) == "x" * 100
+    assert _smart_truncate("short", 100) == "short"
+
+
+# --------------------------------------------------------
+# TEST 11:
+# prepare_topic should skip an article whose content_hash
+# matches its existing summary without parsing either file.
+# --------------------------------------------------------
+def test_prepare_topic_skips_unchanged_hash_without_parsing(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+
+    clean = write_clean_file(tmp_path, "big_article", {
+        "url": "https://example.com",
+        "content": "Nanjing " * 2000,
+        "content_hash": "abc123",
+    })
+    out = tmp_path / "summarized" / "big_article.json"
+    out.parent.mkdir(parents=True)
+    out.write_text(json.dumps({"content_hash": "abc123", "summary_en": "x"}), encoding="utf-8")
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    assert prepare_topic("big_article", clean) is None
+    assert loads.call_count == 0
+
+
+# --------------------------------------------------------
+# TEST 12:
+# chat_once should retry a transient connection error and
+# return the reply from the next attempt.
+# --------------------------------------------------------
+@patch("summarizer.app.time.sleep")
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_retries_transient_errors(mock_llm, mock_sleep):
+    mock_llm.side_effect = [
+        httpx.ConnectError("connection refused"),
+        MagicMock(choices=[MagicMock(message=MagicMock(content="Recovered"))]),
+    ]
+    assert chat_once("sys", "retry me") == "Recovered"
+    assert mock_llm.call_count == 2
+    assert mock_sleep.call_count == 1
+
+
+# --------------------------------------------------------
+# TEST 13:
+# translate_zh_pair_from_en should get both Chinese scripts
+# from one JSON-mode call, and report unusable replies as
+# (None, None) so the caller falls back to separate calls.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_translate_zh_pair_from_en_single_json_call(mock_llm):
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(
+        content='{"hans": "南京是一座城市。", "hant": "南京是一座城市。"}'
+    ))])
+    assert translate_zh_pair_from_en("Nanjing is a city.", None) == (
+        "南京是一座城市。", "南京是一座城市。"
+    )
+    assert mock_llm.call_count == 1
+    assert mock_llm.call_args.kwargs["response_format"] == {"type": "json_object"}
+
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content="not json"))])
+    assert translate_zh_pair_from_en("Another summary.", None) == (None, None)
+
+
+# --------------------------------------------------------
+# TEST 14:
+# summarize_en_batch should summarize several articles in
+# one call, and leave every entry None when the reply does
+# not have one summary per article.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_summarize_en_batch_single_call_and_fallback(mock_llm):
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(
+        content='{"summaries": ["First.", "Second."]}'
+    ))])
+    assert summarize_en_batch(["Article one.", "Article two."]) == ["First.", "Second."]
+    assert mock_llm.call_count == 1
+
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(
+        content='{"summaries": ["Only one."]}'
+    ))])
+    assert summarize_en_batch(["Article three.", "Article four."]) == [None, None]
+
+
+# --------------------------------------------------------
+# TEST 15:
+# prepare_topic should reject a clean file smaller than
+# MIN_INPUT_CHARS bytes without parsing it.
+# --------------------------------------------------------
+def test_prepare_topic_skips_tiny_file_without_parsing(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+
+    clean = write_clean_file(tmp_path, "stub", {
+        "url": "https://example.com",
+        "lang": "en",
+        "content": "Too short.",
+    })
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    assert prepare_topic("stub", clean) is None
+    assert loads.call_count == 0
+
+
+# --------------------------------------------------------
+# TEST 16:
+# With LLM_STREAM=1, chat_once should join the streamed
+# deltas into one reply.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_joins_streamed_reply(mock_llm, monkeypatch):
+    monkeypatch.setattr("summarizer.app.LLM_STREAM", "1")
+
+    def _chunk(text):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    mock_llm.return_value = iter([_chunk("Streamed "), _chunk(None), _chunk("reply. ")])
+    assert chat_once("sys", "stream me") == "Streamed reply."
+    assert mock_llm.call_args.kwargs["stream"] is True
+
+
+# --------------------------------------------------------
+# TEST 17:
+# Recent LLM replies are also kept in memory, so a repeat
+# call is answered even without its disk cache file.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_memory_cache_layer(mock_llm, tmp_path):
+    mock_llm.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Remembered"))]
+    )
+    assert chat_once("sys", "memory input") == "Remembered"
+    for f in (tmp_path / "llm_cache").rglob("*.txt"):
+        f.unlink()
+    assert chat_once("sys", "memory input") == "Remembered"
+    assert mock_llm.call_count == 1
+
+
+# --------------------------------------------------------
+# TEST 18:
+# With MAX_INPUT_TOKENS set, Chinese input (about one token
+# per character) is cut much shorter than English input.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_caps_estimated_input_tokens(mock_llm, monkeypatch):
+    monkeypatch.setattr("summarizer.app.MAX_INPUT_TOKENS", 100)
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content="ok"))])
+
+    chat_once("sys", "南京是江苏省的省会。" * 50)
+    sent_zh = mock_llm.call_args.kwargs["messages"][1]["content"]
+    chat_once("sys", "Nanjing is the capital of Jiangsu. " * 10)
+    sent_en = mock_llm.call_args.kwargs["messages"][1]["content"]
+
+    assert len(sent_zh) <= 120
+    assert len(sent_en) == len("Nanjing is the capital of Jiangsu. " * 10)
+
+
+# --------------------------------------------------------
+# TEST 19:
+# write_summary replaces the summary file whole and leaves
+# no temporary file behind.
+# --------------------------------------------------------
+def test_write_summary_replaces_file_atomically(tmp_path):
+    out_path = tmp_path / "summaries" / "topic.json"
+
+    assert write_summary(out_path, b'{"a": 1}')
+    assert write_summary(out_path, b'{"b": 2}')
+
+    assert out_path.read_bytes() == b'{"b": 2}'
+    assert [p.name for p in out_path.parent.iterdir()] == ["topic.json"]
+
+
+# --------------------------------------------------------
+# TEST 20:
+# The article title goes into the user message, so the
+# system prompt is identical for every article (and can be
+# prefix-cached by the LLM server).
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_summarize_zh_keeps_system_prompt_fixed(mock_llm):
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content="摘要"))])
+
+    summarize_zh("南京是江苏省的省会。" * 40, use_trad=False, main_title="南京")
+    with_title = mock_llm.call_args.kwargs["messages"]
+    summarize_zh("南京是江苏省的省会。" * 40, use_trad=False, main_title=None)
+    without_title = mock_llm.call_args.kwargs["messages"]
+
+    assert with_title[0] == without_title[0]
+    assert "「南京」" in with_title[1]["content"]
+
+
+# --------------------------------------------------------
+# TEST 21:
+# Every call caps the reply with max_tokens; a batched call
+# gets room for all of its summaries.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_sends_max_tokens(mock_llm, monkeypatch):
+    monkeypatch.setattr("summarizer.app.LLM_MAX_TOKENS", 300)
+    mock_llm.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content='{"summaries": ["A.", "B."]}'))]
+    )
+
+    chat_once("sys", "single input")
+    assert mock_llm.call_args.kwargs["max_tokens"] == 300
+
+    summarize_en_batch(["first article", "second article"])
+    assert mock_llm.call_args.kwargs["max_tokens"] == 600
+
+
+# --------------------------------------------------------
+# TEST 22:
+# A rate-limited reply's Retry-After header sets the
+# backoff before the next attempt.
+# --------------------------------------------------------
+@patch("summarizer.app.time.sleep")
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_honours_retry_after(mock_llm, mock_sleep):
+    request = httpx.Request("POST", "http://brain:8000/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": "20"}, request=request)
+    mock_llm.side_effect = [
+        RateLimitError("busy", response=response, body=None),
+        MagicMock(choices=[MagicMock(message=MagicMock(content="Recovered"))]),
+    ]
+    assert chat_once("sys", "rate limited") == "Recovered"
+    assert mock_sleep.call_args.args[0] == 20.0
+
+
+# --------------------------------------------------------
+# TEST 23:
+# A skipped article is remembered in the skip index, so after
+# a restart it is skipped again without reading the file.
+# --------------------------------------------------------
+def test_skip_index_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+
+    clean = write_clean_file(tmp_path, "category_page", {
+        "url": "https://en.wikipedia.org/wiki/Category:Nanjing",
+        "doc_type": "category",
+        "content": "Nanjing " * 200,
+    })
+    assert process_once() == 0
+
+    # simulate a restart: in-memory state is gone, the index file is not
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+    load_index()
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    assert prepare_topic("category_page", clean) is None
+    assert loads.call_count == 0
+
+
+# --------------------------------------------------------
+# TEST 24:
+# After a restart, the clean-file scan reuses the indexed
+# topic_id/score of unchanged files instead of parsing them.
+# --------------------------------------------------------
+def test_index_restores_clean_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+
+    clean = write_clean_file(tmp_path, "nanjing", {
+        "topic_id": "nanjing",
+        "url": "https://en.wikipedia.org/wiki/Nanjing",
+        "content": "Nanjing " * 200,
+    })
+    load_index()
+    assert collect_best_clean_paths() == {"nanjing": clean}
+    save_index()
+
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+    load_index()
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    assert collect_best_clean_paths() == {"nanjing": clean}
+    assert loads.call_count == 0
+
+
+# --------------------------------------------------------
+# TEST 25:
+# Reading clean files on several threads picks the same
+# best file per topic as reading them one by one.
+# --------------------------------------------------------
+def test_collect_best_clean_paths_parallel_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    for i in range(6):
+        write_clean_file(tmp_path, f"doc_{i}", {
+            "topic_id": f"topic_{i % 3}",
+            "zh_url": "https://zh.wikipedia.org/wiki/x" if i == 4 else "",
+            "retrieved_at": f"2024-01-0{i + 1}",
+        })
+
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app.CLEAN_SCAN_WORKERS", 1)
+    serial = collect_best_clean_paths()
+
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app.CLEAN_SCAN_WORKERS", 4)
+    parallel = collect_best_clean_paths()
+
+    assert parallel == serial
+    assert sorted(p.name for p in serial.values()) == ["doc_3.json", "doc_4.json", "doc_5.json"]
+
+
+# --------------------------------------------------------
+# TEST 26:
+# The JSON helpers give the same results with and without
+# orjson installed.
+# --------------------------------------------------------
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_with_and_without_orjson(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("summarizer.app.orjson", None)
+    obj = {"title": "南京", "n": [1, 2]}
+    raw = json_dumps_bytes(obj)
+    assert "南京".encode("utf-8") in raw
+    assert raw.startswith(b'{\n  "title"')
+    assert json_loads(raw) == obj
+    assert json_loads(raw.decode("utf-8")) == obj
+
+
+# --------------------------------------------------------
+# TEST 27:
+# Skip decisions made under other skip settings are not
+# reused after a restart; the file is checked again.
+# --------------------------------------------------------
+def test_index_drops_skips_when_skip_settings_change(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+
+    clean = write_clean_file(tmp_path, "category_page", {
+        "url": "https://en.wikipedia.org/wiki/Category:Nanjing",
+        "doc_type": "category",
+        "content": "Nanjing " * 200,
+    })
+    assert process_once() == 0
+
+    # restart with category pages no longer skipped
+    monkeypatch.setattr("summarizer.app.SKIP_CATEGORY_DOCS", "0")
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+    load_index()
+
+    loads = MagicMock(side_effect=orjson.loads)
+    monkeypatch.setattr("summarizer.app.orjson.loads", loads)
+    prepare_topic("category_page", clean)
+    assert loads.call_count == 1
+
+
+# --------------------------------------------------------
+# TEST 28:
+# An index written under another schema version is dropped
+# instead of being read with the current row layout.
+# --------------------------------------------------------
+def test_index_rebuilt_on_schema_mismatch(tmp_path, monkeypatch):
+    index_path = tmp_path / "index.sqlite"
+    conn = sqlite3.connect(index_path)
+    conn.executescript("""
+    CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    INSERT INTO meta VALUES ('schema_version', '0');
+    CREATE TABLE clean_records(path TEXT PRIMARY KEY, stale TEXT);
+    INSERT INTO clean_records VALUES ('/data/clean/old.json', 'x');
+    """)
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+    load_index()
+
+    assert summarizer_app._clean_records == {}
+    conn = sqlite3.connect(index_path)
+    version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    conn.close()
+    assert version == (summarizer_app._INDEX_SCHEMA_VERSION,)
+
+
+# --------------------------------------------------------
+# TEST 29:
+# The Simplified and Traditional translations of a summary
+# start with the same text (the summary) and differ only in
+# the target line at the end, so the server can reuse the
+# shared prefix.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_translate_zh_calls_share_summary_prefix(mock_llm):
+    mock_llm.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content="南京。"))])
+    summary = "Nanjing is the capital of Jiangsu."
+
+    translate_zh_from_en(summary, use_trad=False, main_title="南京")
+    hans = mock_llm.call_args.kwargs["messages"]
+    translate_zh_from_en(summary, use_trad=True, main_title="南京")
+    hant = mock_llm.call_args.kwargs["messages"]
+
+    assert hans[0] == hant[0]
+    assert hans[1]["content"].startswith(summary)
+    assert hant[1]["content"].startswith(summary)
+    assert hant[1]["content"].splitlines()[-1].startswith("Target: Traditional Chinese")
+
+
+# --------------------------------------------------------
+# TEST 30:
+# Batched relevance checks stay within MAX_LLM_CHARS, keep at
+# least RELEVANCE_MIN_SNIPPET_CHARS per article by splitting
+# the batch, and check one by one when a batch call fails.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_classify_relevance_batch_splits_and_falls_back(mock_llm, monkeypatch):
+    monkeypatch.setattr("summarizer.app.RELEVANCE_BATCH_CHARS", 3500)
+    samples = [f"Article {i} about Nanjing. " + "x" * 2000 for i in range(4)]
+
+    mock_llm.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="1: IRRELEVANT\n2: IRRELEVANT\n3: IRRELEVANT\nIRRELEVANT"))]
+    )
+    assert classify_relevance_batch(samples) == [False] * 4
+    assert mock_llm.call_count == 2  # three in one call, the last on its own
+    batch_text = mock_llm.call_args_list[0].kwargs["messages"][1]["content"]
+    assert 3 * 1000 <= len(batch_text) <= 3500
+
+    # a failed batch call is not read as "keep everything"
+    mock_llm.reset_mock()
+    mock_llm.side_effect = [
+        ValueError("context length exceeded"),
+        *[MagicMock(choices=[MagicMock(message=MagicMock(content="IRRELEVANT"))])] * 4,
+    ]
+    assert classify_relevance_batch(samples) == [False] * 4
+
+
+# --------------------------------------------------------
+# TEST 31:
+# A reply cut off at max_tokens is not cached, and the cache
+# key separates plain and JSON-mode calls on the same text.
+# --------------------------------------------------------
+@patch("summarizer.app.client.chat.completions.create")
+def test_chat_once_cache_skips_cut_off_and_keys_on_mode(mock_llm):
+    cut = MagicMock(message=MagicMock(content="Truncated"), finish_reason="length")
+    full = MagicMock(message=MagicMock(content="Complete"), finish_reason="stop")
+    mock_llm.side_effect = [
+        MagicMock(choices=[cut]),
+        MagicMock(choices=[full]),
+        MagicMock(choices=[MagicMock(message=MagicMock(content="{}"), finish_reason="stop")]),
+    ]
+
+    assert chat_once("sys", "same input") == "Truncated"
+    assert chat_once("sys", "same input") == "Complete"
+    assert chat_once("sys", "same input") == "Complete"  # cached now
+    assert chat_once("sys", "same input", json_mode=True) == "{}"
+    assert mock_llm.call_count == 3
+
+
+# --------------------------------------------------------
+# TEST 32:
+# When the LLM produces no summary the topic is not written
+# (so its content_hash isn't recorded) and is reported as failed.
+# --------------------------------------------------------
+def test_process_once_reports_failed_topics(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.DATA_DIR", tmp_path)
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    monkeypatch.setattr("summarizer.app.SUMMARY_DIR", tmp_path / "summarized")
+    monkeypatch.setattr("summarizer.app._clean_records", {})
+    monkeypatch.setattr("summarizer.app._skipped_signatures", {})
+    monkeypatch.setattr("summarizer.app._index_saved", None)
+    monkeypatch.setattr("summarizer.app.chat_once", lambda *a, **k: None)
+    (tmp_path / "summarized").mkdir()
+
+    clean = write_clean_file(tmp_path, "nanjing", {
+        "topic_id": "nanjing",
+        "url": "https://en.wikipedia.org/wiki/Nanjing",
+        "content": "Nanjing is the capital of Jiangsu province. " * 20,
+    })
+    failed = set()
+    assert process_once(failed=failed) == 0
+    assert failed == {clean}
+    assert not (tmp_path / "summarized" / "nanjing.json").exists()
+
+
+# --------------------------------------------------------
+# TEST 33:
+# The watch loop retries failed topics on its next tick
+# instead of waiting for the hourly full sweep.
+# --------------------------------------------------------
+def test_watch_loop_retries_failed_topics(tmp_path, monkeypatch):
+    monkeypatch.setattr("summarizer.app.CLEAN_DIR", tmp_path / "clean")
+    failed_path = tmp_path / "clean" / "nanjing.json"
+    calls = []
+
+    def fake_process_once(changed_paths=None, failed=None):
+        calls.append(changed_paths)
+        if changed_paths is None:
+            failed.add(failed_path)
+        return 0
+
+    monkeypatch.setattr("summarizer.app.process_once", fake_process_once)
+    monkeypatch.setattr("summarizer.app.watch_files", lambda *a, **k: iter([set(), set()]))
+    summarizer_app.run_watch_loop()
+
+    # start-up sweep, one retry of the failed topic, then an idle tick
+    assert calls == [None, {failed_path}]